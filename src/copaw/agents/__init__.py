@@ -22,13 +22,22 @@ __all__ = ["CoPawAgent", "create_model_and_formatter"]
 
 
 def __getattr__(name: str):
-    """Lazy load heavy imports."""
+    """Lazy load heavy imports.
+
+    The resolved object is stored in the module globals, so later lookups
+    no longer go through this function.
+    """
     if name == "CoPawAgent":
         from .react_agent import CoPawAgent
 
-        return CoPawAgent
-    if name == "create_model_and_formatter":
+        obj = CoPawAgent
+    elif name == "create_model_and_formatter":
         from .model_factory import create_model_and_formatter
 
-        return create_model_and_formatter
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        obj = create_model_and_formatter
+    else:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}",
+        )
+    globals()[name] = obj
+    return obj
@@ -3,6 +3,7 @@
 
 This module handles system commands like /compact, /new, /clear, etc.
 """
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
@@ -117,6 +118,26 @@ class CommandHandler:
         self.memory_manager = memory_manager
         self._enable_memory_manager = enable_memory_manager
 
+        # Command name -> bound handler, resolved once
+        self._dispatch = {
+            name: getattr(self, f"_process_{name}")
+            for name in self.SYSTEM_COMMANDS
+        }
+
+    def _parse_command(self, query: str | None) -> str | None:
+        """Extract the system command name from a query.
+
+        Args:
+            query: User query string
+
+        Returns:
+            Command name if query is a system command, otherwise None
+        """
+        if not isinstance(query, str) or query[:1] != "/":
+            return None
+        command = query.strip().lstrip("/")
+        return command if command in self.SYSTEM_COMMANDS else None
+
     def is_command(self, query: str | None) -> bool:
         """Check if the query is a system command.
 
@@ -126,9 +147,7 @@ class CommandHandler:
         Returns:
             True if query is a system command
         """
-        if not isinstance(query, str) or not query.startswith("/"):
-            return False
-        return query.strip().lstrip("/") in self.SYSTEM_COMMANDS
+        return self._parse_command(query) is not None
 
     async def _make_system_msg(self, text: str) -> Msg:
         """Create a system response message.
@@ -149,11 +168,22 @@ class CommandHandler:
         """Check if memory manager is available."""
         return self._enable_memory_manager and self.memory_manager is not None
 
-    async def _mark_messages_compressed(self, messages: list[Msg]) -> int:
-        """Mark messages as compressed and return count."""
+    async def _mark_messages_compressed(
+        self,
+        messages: list[Msg],
+        msg_ids: list[str] | None = None,
+    ) -> int:
+        """Mark messages as compressed and return count.
+
+        Args:
+            messages: Messages to mark
+            msg_ids: Precomputed ids of ``messages``, if already available
+        """
+        if msg_ids is None:
+            msg_ids = [msg.id for msg in messages]
         return await self.memory.update_messages_mark(
             new_mark=_MemoryMark.COMPRESSED,
-            msg_ids=[msg.id for msg in messages],
+            msg_ids=msg_ids,
         )
 
     async def _process_compact(self, messages: list[Msg]) -> Msg:
@@ -171,13 +201,16 @@ class CommandHandler:
                 "- Enable memory manager to use this feature",
             )
 
-        self.memory_manager.add_async_summary_task(messages=messages)
+        await self.memory_manager.add_async_summary_task(messages=messages)
         compact_content = await self.memory_manager.compact_memory(
             messages_to_summarize=messages,
             previous_summary=self.memory.get_compressed_summary(),
         )
-        await self.memory.update_compressed_summary(compact_content)
-        updated_count = await self._mark_messages_compressed(messages)
+        # Summary update and mark update are independent of each other
+        _, updated_count = await asyncio.gather(
+            self.memory.update_compressed_summary(compact_content),
+            self._mark_messages_compressed(messages),
+        )
         logger.info(
             f"Marked {updated_count} messages as compacted "
             f"with:\n{compact_content}",
@@ -206,7 +239,7 @@ class CommandHandler:
                 "- Enable memory manager to use this feature",
             )
 
-        self.memory_manager.add_async_summary_task(messages=messages)
+        await self.memory_manager.add_async_summary_task(messages=messages)
         await self.memory.update_compressed_summary("")
         updated_count = await self._mark_messages_compressed(messages)
         logger.info(f"Marked {updated_count} messages as compacted")
@@ -275,7 +308,10 @@ class CommandHandler:
                 else:
                     block_infos = []
                     total_tokens = 0
+                    # Only the first 100 chars are shown, so keep just
+                    # enough of each block instead of joining them all
                     text_parts = []
+                    text_len = 0
                     for block in content:
                         block_type = block.get("type", "unknown")
                         block_tokens, block_str = _get_block_tokens(
@@ -283,7 +319,9 @@ class CommandHandler:
                             block_type,
                         )
                         total_tokens += block_tokens
-                        text_parts.append(block_str)
+                        if text_len < 100:
+                            text_parts.append(block_str[: 100 - text_len])
+                        text_len += len(block_str)
                         block_infos.append(
                             f"{block_type}(tokens={block_tokens})",
                         )
@@ -291,8 +329,8 @@ class CommandHandler:
                     seq_blocks = f"\n    content: [{', '.join(block_infos)}]"
                     text_preview = "".join(text_parts)
                     preview = (
-                        f"{text_preview[:100]}..."
-                        if len(text_preview) > 100
+                        f"{text_preview}..."
+                        if text_len > 100
                         else text_preview
                     )
             except Exception as e:
@@ -350,14 +388,14 @@ class CommandHandler:
         Raises:
             RuntimeError: If command is not recognized
         """
+        command = self._parse_command(query)
+        handler = self._dispatch.get(command) if command else None
+        if handler is None:
+            raise RuntimeError(f"Unknown command: {query}")
+        logger.info(f"Processing command: {command}")
+
         messages = await self.memory.get_memory(
             exclude_mark=_MemoryMark.COMPRESSED,
             prepend_summary=False,
         )
-        command = query.strip().lstrip("/")
-        logger.info(f"Processing command: {command}")
-
-        handler = getattr(self, f"_process_{command}", None)
-        if handler is None:
-            raise RuntimeError(f"Unknown command: {query}")
         return await handler(messages)
@@ -4,6 +4,7 @@
 This hook checks for BOOTSTRAP.md on the first user interaction and
 prepends guidance to help set up the agent's identity and preferences.
 """
+import asyncio
 import logging
 from pathlib import Path
 from typing import Any
@@ -38,6 +39,9 @@ class BootstrapHook:
         """
         self.working_dir = working_dir
         self.language = language
+        # Once bootstrap is completed (or BOOTSTRAP.md is absent) the hook
+        # never fires again, so skip the filesystem checks from then on.
+        self._done: bool = False
 
     async def __call__(
         self,
@@ -53,17 +57,24 @@ class BootstrapHook:
         Returns:
             None (hook doesn't modify kwargs)
         """
+        if self._done:
+            return None
+
         try:
             bootstrap_path = self.working_dir / "BOOTSTRAP.md"
             bootstrap_completed_flag = (
                 self.working_dir / ".bootstrap_completed"
             )
 
-            # Check if bootstrap has already been triggered before
-            if bootstrap_completed_flag.exists():
+            # Check if bootstrap has already been triggered before.
+            # Filesystem calls run off the event loop; once _done is set
+            # they are skipped entirely.
+            if await asyncio.to_thread(bootstrap_completed_flag.exists):
+                self._done = True
                 return None
 
-            if not bootstrap_path.exists():
+            if not await asyncio.to_thread(bootstrap_path.exists):
+                self._done = True
                 return None
 
             messages = await agent.memory.get_memory()
@@ -90,7 +101,8 @@ class BootstrapHook:
             logger.debug("Bootstrap guidance prepended to first user message")
 
             # Create completion flag to prevent repeated triggering
-            bootstrap_completed_flag.touch()
+            await asyncio.to_thread(bootstrap_completed_flag.touch)
+            self._done = True
             logger.debug("Created bootstrap completion flag")
 
         except Exception as e:
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING, Any
 from agentscope.agent._react_agent import _MemoryMark
 
 from ..utils import (
-    check_valid_messages,
+    find_keep_boundary,
     safe_count_message_tokens,
 )
 from ..utils.tool_message_utils import _truncate_text
@@ -25,6 +25,24 @@ logger = logging.getLogger(__name__)
 # Default max length for tool result text truncation during compaction
 _DEFAULT_COMPACT_TOOL_RESULT_MAX_LENGTH = 10000
 
+# Per-message allowance for text the formatter adds around content blocks
+# (e.g. "The returned image can be found at: ..." wrappers)
+_FORMATTER_OVERHEAD_BYTES = 256
+
+
+def _msg_size_upper_bound(msg) -> int:
+    """Upper bound on the token count of a message's formatted text.
+
+    The tokenizer is byte-level BPE, so every token covers at least one
+    UTF-8 byte. The repr of the content contains all of its text (plus
+    keys and quotes), which together with a fixed per-message allowance
+    bounds what the formatter emits.
+    """
+    return (
+        len(str(msg.content).encode("utf-8", errors="replace"))
+        + _FORMATTER_OVERHEAD_BYTES
+    )
+
 
 def _truncate_tool_result_texts(
     messages: list,
@@ -86,6 +104,8 @@ class MemoryCompactionHook:
         self.memory_manager = memory_manager
         self.memory_compact_threshold = memory_compact_threshold
         self.keep_recent = keep_recent
+        # Msg id -> size upper bound, for messages seen in the last call
+        self._size_cache: dict[str, int] = {}
 
     @property
     def enable_truncate_tool_result_texts(self) -> bool:
@@ -99,6 +119,24 @@ class MemoryCompactionHook:
             "false",
         ).lower() in ("true", "1", "yes")
 
+    def _size_upper_bound(self, messages: list) -> int:
+        """Sum per-message token upper bounds, reusing cached values.
+
+        Only entries for the given messages are kept, so the cache stays
+        bounded by the current number of uncompressed messages.
+        """
+        old_cache = self._size_cache
+        new_cache: dict[str, int] = {}
+        total = 0
+        for msg in messages:
+            size = old_cache.get(msg.id)
+            if size is None:
+                size = _msg_size_upper_bound(msg)
+            new_cache[msg.id] = size
+            total += size
+        self._size_cache = new_cache
+        return total
+
     async def __call__(
         self,
         agent,
@@ -141,11 +179,10 @@ class MemoryCompactionHook:
             if len(remaining_messages) <= self.keep_recent:
                 return None
 
-            keep_length = self.keep_recent
-            while keep_length > 0 and not check_valid_messages(
-                remaining_messages[-keep_length:],
-            ):
-                keep_length -= 1
+            keep_length = find_keep_boundary(
+                remaining_messages,
+                self.keep_recent,
+            )
 
             if keep_length > 0:
                 messages_to_compact = remaining_messages[:-keep_length]
@@ -158,6 +195,14 @@ class MemoryCompactionHook:
             if self.enable_truncate_tool_result_texts and messages_to_keep:
                 _truncate_tool_result_texts(messages_to_keep)
 
+            # Skip formatting and tokenizing when the compactable messages
+            # cannot possibly exceed the threshold
+            if (
+                self._size_upper_bound(messages_to_compact)
+                <= self.memory_compact_threshold
+            ):
+                return None
+
             prompt = await agent.formatter.format(msgs=messages_to_compact)
             estimated_tokens: int = await safe_count_message_tokens(prompt)
             logger.debug(
@@ -178,15 +223,17 @@ class MemoryCompactionHook:
                     len(messages_to_keep),
                 )
 
-                self.memory_manager.add_async_summary_task(
+                await self.memory_manager.add_async_summary_task(
                     messages=messages_to_compact,
                 )
 
+                # Only hide the messages once their summary is in place, so
+                # a failed compaction or a session saved mid-turn never
+                # drops them
                 compact_content = await self.memory_manager.compact_memory(
                     messages_to_summarize=messages_to_compact,
                     previous_summary=agent.memory.get_compressed_summary(),
                 )
-
                 await agent.memory.update_compressed_summary(compact_content)
                 updated_count = await agent.memory.update_messages_mark(
                     new_mark=_MemoryMark.COMPRESSED,
@@ -1,12 +1,44 @@
 # -*- coding: utf-8 -*-
 """Agent markdown manager for reading and writing markdown files in working
 and memory directories."""
+import functools
+import os
 from datetime import datetime
 from pathlib import Path
 
 from ...constant import WORKING_DIR
 
 
+@functools.lru_cache(maxsize=4096)
+def _ts_to_iso(timestamp: float) -> str:
+    """Convert a POSIX timestamp to a local ISO 8601 string."""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def _list_md_files(directory: Path) -> list[dict]:
+    """List markdown files with metadata in a directory.
+
+    Uses ``os.scandir`` so file type and stat info come from the
+    directory entry instead of separate ``is_file``/``stat`` calls.
+    """
+    result = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if not entry.name.endswith(".md") or not entry.is_file():
+                continue
+            stat = entry.stat()
+            result.append(
+                {
+                    "filename": entry.name,
+                    "size": stat.st_size,
+                    "path": entry.path,
+                    "created_time": _ts_to_iso(stat.st_ctime),
+                    "modified_time": _ts_to_iso(stat.st_mtime),
+                },
+            )
+    return result
+
+
 class AgentMdManager:
     """Manager for reading and writing markdown files in working and memory
     directories."""
@@ -28,25 +60,7 @@ class AgentMdManager:
                 - created_time: file creation timestamp
                 - modified_time: file modification timestamp
         """
-        md_files = list(self.working_dir.glob("*.md"))
-        result = []
-        for f in md_files:
-            if f.is_file():
-                stat = f.stat()
-                result.append(
-                    {
-                        "filename": f.name,
-                        "size": stat.st_size,
-                        "path": str(f),
-                        "created_time": datetime.fromtimestamp(
-                            stat.st_ctime,
-                        ).isoformat(),
-                        "modified_time": datetime.fromtimestamp(
-                            stat.st_mtime,
-                        ).isoformat(),
-                    },
-                )
-        return result
+        return _list_md_files(self.working_dir)
 
     def read_working_md(self, md_name: str) -> str:
         """Read markdown file content from the working directory.
@@ -81,25 +95,7 @@ class AgentMdManager:
                 - created_time: file creation timestamp
                 - modified_time: file modification timestamp
         """
-        md_files = list(self.memory_dir.glob("*.md"))
-        result = []
-        for f in md_files:
-            if f.is_file():
-                stat = f.stat()
-                result.append(
-                    {
-                        "filename": f.name,
-                        "size": stat.st_size,
-                        "path": str(f),
-                        "created_time": datetime.fromtimestamp(
-                            stat.st_ctime,
-                        ).isoformat(),
-                        "modified_time": datetime.fromtimestamp(
-                            stat.st_mtime,
-                        ).isoformat(),
-                    },
-                )
-        return result
+        return _list_md_files(self.memory_dir)
 
     def read_memory_md(self, md_name: str) -> str:
         """Read markdown file content from the memory directory.
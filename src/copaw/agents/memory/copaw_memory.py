@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Custom memory implementation with bugfixes and extensions."""
+import json
 import logging
 
 from agentscope.agent._react_agent import _MemoryMark
@@ -8,10 +9,117 @@ from agentscope.message import Msg
 
 logger = logging.getLogger(__name__)
 
+# Use orjson for state (de)serialization when available
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+# Static text wrapped around the compressed summary in get_memory
+_SUMMARY_PREFIX = "<previous-summary>\n"
+_SUMMARY_SUFFIX = (
+    "\n</previous-summary>\n"
+    "The above is a summary of our previous conversation.\n"
+    "Use it as context to maintain continuity."
+)
+
 
 class CoPawInMemoryMemory(InMemoryMemory):
     """Extended InMemoryMemory with bugfixes and summary support."""
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # (summary string, wrapper Msg) built for the current summary
+        self._summary_msg_cache: tuple[str, Msg] | None = None
+        # (mark, exclude_mark, prepend_summary) -> filtered messages, shared
+        # by the hooks and commands that read memory within one turn.
+        # Cleared by every mutator; the content length guards against
+        # direct edits of self.content (e.g. content.clear()).
+        self._view_cache: dict[tuple, list[Msg]] = {}
+        self._view_cache_len = -1
+        # Msg id -> positions in self.content, built lazily and dropped
+        # together with the view cache
+        self._id_index: dict[str, list[int]] | None = None
+
+    def _invalidate_views(self) -> None:
+        """Drop cached get_memory results after the memory changed."""
+        self._view_cache.clear()
+        self._id_index = None
+
+    def _get_id_index(self) -> dict[str, list[int]]:
+        """Get the id -> positions index of self.content."""
+        index = self._id_index
+        if index is None or self._view_cache_len != len(self.content):
+            self._invalidate_views()
+            self._view_cache_len = len(self.content)
+            index = {}
+            for i, (msg, _) in enumerate(self.content):
+                index.setdefault(msg.id, []).append(i)
+            self._id_index = index
+        return index
+
+    async def add(self, *args, **kwargs):
+        """Add messages and invalidate cached views."""
+        result = await super().add(*args, **kwargs)
+        self._invalidate_views()
+        return result
+
+    async def delete(self, *args, **kwargs):
+        """Delete messages and invalidate cached views."""
+        result = await super().delete(*args, **kwargs)
+        self._invalidate_views()
+        return result
+
+    async def delete_by_mark(self, *args, **kwargs):
+        """Delete messages by mark and invalidate cached views."""
+        result = await super().delete_by_mark(*args, **kwargs)
+        self._invalidate_views()
+        return result
+
+    async def clear(self, *args, **kwargs):
+        """Clear the memory and invalidate cached views."""
+        result = await super().clear(*args, **kwargs)
+        self._invalidate_views()
+        return result
+
+    async def update_messages_mark(
+        self,
+        new_mark: str | None,
+        old_mark: str | None = None,
+        msg_ids: list[str] | None = None,
+    ) -> int:
+        """Update message marks and invalidate cached views.
+
+        Adding a mark to given message ids (the compaction path) goes
+        through the id index, i.e. O(len(msg_ids)) instead of scanning
+        the whole memory per id. Other cases use the parent
+        implementation.
+        """
+        if msg_ids is None or new_mark is None or old_mark is not None:
+            result = await super().update_messages_mark(
+                new_mark=new_mark,
+                old_mark=old_mark,
+                msg_ids=msg_ids,
+            )
+            self._invalidate_views()
+            return result
+
+        index = self._get_id_index()
+        content = self.content
+        updated_count = 0
+        for msg_id in set(msg_ids):
+            for i in index.get(msg_id, ()):
+                marks = content[i][1]
+                if new_mark not in marks:
+                    marks.append(new_mark)
+                    updated_count += 1
+
+        # Marks changed, but positions did not; keep the id index
+        self._view_cache.clear()
+        return updated_count
+
     async def get_memory(
         self,
         mark: str | None = None,
@@ -41,45 +149,61 @@ class CoPawInMemoryMemory(InMemoryMemory):
                 f"{type(exclude_mark)}.",
             )
 
-        # Filter messages based on mark
-        filtered_content = [
-            (msg, marks)
-            for msg, marks in self.content
-            if mark is None or mark in marks
-        ]
-
-        # Further filter messages based on exclude_mark
-        if exclude_mark is not None:
-            filtered_content = [
-                (msg, marks)
-                for msg, marks in filtered_content
-                if exclude_mark not in marks
-            ]
+        if self._view_cache_len != len(self.content):
+            self._invalidate_views()
+            self._view_cache_len = len(self.content)
+
+        key = (mark, exclude_mark, prepend_summary)
+        cached = self._view_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        # Filter messages by mark and exclude_mark in a single pass
+        filtered_msgs = []
+        append = filtered_msgs.append
+        for msg, marks in self.content:
+            if mark is not None and mark not in marks:
+                continue
+            if exclude_mark is not None and exclude_mark in marks:
+                continue
+            append(msg)
 
         if prepend_summary and self._compressed_summary:
-            previous_summary = f"""
-<previous-summary>
-{self._compressed_summary}
-</previous-summary>
-The above is a summary of our previous conversation.
-Use it as context to maintain continuity.
-                    """.strip()
-
-            return [
+            filtered_msgs.insert(0, self._get_summary_msg())
+
+        self._view_cache[key] = filtered_msgs
+        return list(filtered_msgs)
+
+    def _get_summary_msg(self) -> Msg:
+        """Get the previous-summary Msg, rebuilding it only when the
+        compressed summary has changed."""
+        cache = self._summary_msg_cache
+        if cache is None or cache[0] is not self._compressed_summary:
+            previous_summary = (
+                _SUMMARY_PREFIX + self._compressed_summary + _SUMMARY_SUFFIX
+            )
+
+            cache = (
+                self._compressed_summary,
                 Msg(
                     "user",
                     previous_summary,
                     "user",
                 ),
-                *[msg for msg, _ in filtered_content],
-            ]
-
-        return [msg for msg, _ in filtered_content]
+            )
+            self._summary_msg_cache = cache
+        return cache[1]
 
     def get_compressed_summary(self) -> str:
         """Get the compressed summary of the memory."""
         return self._compressed_summary
 
+    async def update_compressed_summary(self, summary: str) -> None:
+        """Update the compressed summary and drop the cached summary Msg."""
+        await super().update_compressed_summary(summary)
+        self._summary_msg_cache = None
+        self._invalidate_views()
+
     def state_dict(self) -> dict:
         """Get the state dictionary for serialization."""
         return {
@@ -87,6 +211,28 @@ Use it as context to maintain continuity.
             "_compressed_summary": self._compressed_summary,
         }
 
+    def state_bytes(self) -> bytes:
+        """Serialize the state dictionary to JSON bytes.
+
+        Uses orjson if installed, otherwise compact stdlib json.
+        """
+        state = self.state_dict()
+        if _ORJSON_AVAILABLE:
+            return orjson.dumps(state)
+        return json.dumps(
+            state,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+    def load_state_bytes(self, buf: bytes, strict: bool = True) -> None:
+        """Load the state from JSON bytes produced by ``state_bytes``."""
+        if _ORJSON_AVAILABLE:
+            state = orjson.loads(buf)
+        else:
+            state = json.loads(buf)
+        self.load_state_dict(state, strict=strict)
+
     def load_state_dict(self, state_dict: dict, strict: bool = True) -> None:
         """Load the state dictionary for deserialization."""
         if strict and "content" not in state_dict:
@@ -95,21 +241,22 @@ Use it as context to maintain continuity.
                 "InMemoryMemory.",
             )
 
-        self.content = []
+        content = []
         for item in state_dict.get("content", []):
             if isinstance(item, (tuple, list)) and len(item) == 2:
                 msg_dict, marks = item
-                msg = Msg.from_dict(msg_dict)
-                self.content.append((msg, marks))
+                content.append((Msg.from_dict(msg_dict), marks))
 
             elif isinstance(item, dict):
                 # For compatibility with older versions
-                msg = Msg.from_dict(item)
-                self.content.append((msg, []))
+                content.append((Msg.from_dict(item), []))
 
             else:
                 raise ValueError(
                     "Invalid item format in state_dict for InMemoryMemory.",
                 )
+        self.content = content
 
         self._compressed_summary = state_dict.get("_compressed_summary", "")
+        self._summary_msg_cache = None
+        self._invalidate_views()
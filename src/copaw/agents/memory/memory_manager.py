@@ -8,13 +8,21 @@ Inherits from ReMeFs to provide memory management capabilities including:
 - Memory file retrieval
 """
 import asyncio
+import contextlib
 import datetime
+import functools
+import hashlib
 import json
 import logging
+import math
 import os
 import platform
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, NamedTuple
 
 from agentscope._utils._common import _save_base64_data
 from agentscope.agent import ReActAgent
@@ -24,14 +32,7 @@ from agentscope.formatter._dashscope_formatter import (
     _reformat_messages,
 )
 from agentscope.formatter._formatter_base import FormatterBase
-from agentscope.message import (
-    ImageBlock,
-    AudioBlock,
-    VideoBlock,
-    TextBlock,
-    URLSource,
-)
-from agentscope.message import Msg
+from agentscope.message import Msg, TextBlock
 from agentscope.model import ChatModelBase
 from agentscope.tool import ToolResponse, Toolkit
 
@@ -40,10 +41,25 @@ from ..tools import (
     write_file,
     edit_file,
 )
+from .search_cache import (
+    NUMPY_AVAILABLE,
+    MemorySearchCache,
+    PersistentQueryCache,
+    SemanticQueryCache,
+)
 from ..utils import safe_count_str_tokens
 from ..utils.tool_message_utils import _truncate_text as _truncate_text_impl
 from ...config.utils import load_config
 from ...constant import MEMORY_COMPACT_RATIO
+from ...envs import get_environ_version
+
+# Use orjson for tool call arguments when available
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +87,140 @@ def _truncate_text(text: str, max_length: int | None = None) -> str:
     return _truncate_text_impl(text, max_length)
 
 
+def _dumps_tool_input(tool_input: Any) -> str:
+    """Serialize tool call arguments to a JSON string.
+
+    Uses orjson if installed, falling back to stdlib json for inputs orjson
+    rejects (e.g. non-string keys or integers beyond 64 bits).
+
+    Args:
+        tool_input: The tool call input
+
+    Returns:
+        The JSON string, non-ASCII characters are kept as is
+    """
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(tool_input).decode()
+        except TypeError:
+            pass
+    return json.dumps(tool_input, ensure_ascii=False)
+
+
+# Maximum number of per-message formatting results kept across calls
+_FORMAT_CACHE_SIZE = 4096
+_FORMAT_CACHE: OrderedDict[tuple, tuple[list[dict], dict, int]] = OrderedDict()
+# Formatting may run in worker threads, see _FORMAT_OFFLOAD_MIN_MSGS
+_FORMAT_CACHE_LOCK = threading.Lock()
+
+# Message lists longer than this are formatted in a worker thread
+_FORMAT_OFFLOAD_MIN_MSGS = 32
+
+
+def _content_signature(content: str | list[dict]) -> tuple:
+    """Build a cheap signature of message content for the format cache.
+
+    Text and tool result outputs are represented by their string hashes,
+    which Python caches on the string objects, so in-place edits of a
+    message change the signature without re-serializing it.
+
+    Args:
+        content: The message content
+
+    Returns:
+        Hashable signature of the content
+    """
+    if isinstance(content, str):
+        return (hash(content),)
+
+    signature: list = []
+    for block in content:
+        value = block.get("text", block.get("output"))
+        if isinstance(value, str):
+            signature.append(hash(value))
+        elif isinstance(value, list):
+            signature.append(
+                tuple(
+                    hash(item.get("text", ""))
+                    if isinstance(item, dict)
+                    else None
+                    for item in value
+                ),
+            )
+        else:
+            signature.append(block.get("type"))
+    return tuple(signature)
+
+
+# Tool result media type -> formatter flag enabling its promotion
+_PROMOTE_FLAGS = {
+    "image": "promote_tool_result_images",
+    "audio": "promote_tool_result_audios",
+    "video": "promote_tool_result_videos",
+}
+# Envelope of the promoted media message; blocks are plain dicts at runtime
+_SYSTEM_INFO_OPEN = (
+    "<system-info>The following are the media contents from the tool "
+    "result of '{}':"
+)
+_SYSTEM_INFO_CLOSE = {"type": "text", "text": "</system-info>"}
+
+
+def _media_caption(kind: str, url: str) -> dict:
+    """Build the text block introducing a promoted media file."""
+    return {"type": "text", "text": f"\n- The {kind} from '{url}': "}
+
+
+@dataclass
+class _MsgFormatState:
+    """Output of formatting one message, filled in block by block."""
+
+    max_length: int
+    entries: list[dict[str, Any]] = field(default_factory=list)
+    content_blocks: list[dict[str, Any]] = field(default_factory=list)
+    tool_calls: list[dict[str, Any]] = field(default_factory=list)
+    token_count: int = 0
+    cacheable: bool = True
+
+
+class EmbeddingEnvs(NamedTuple):
+    """Embedding settings read from environment variables."""
+
+    api_key: str
+    base_url: str
+    model_name: str
+    dimensions: int
+    cache_enabled: bool
+
+
+@functools.lru_cache(maxsize=1)
+def _load_emb_envs(environ_version: int) -> EmbeddingEnvs:
+    """Read the embedding settings from the environment.
+
+    Args:
+        environ_version: Version of the env vars, only used as cache key
+
+    Returns:
+        The embedding settings
+    """
+    del environ_version
+    return EmbeddingEnvs(
+        api_key=os.environ.get("EMBEDDING_API_KEY", ""),
+        base_url=os.environ.get(
+            "EMBEDDING_BASE_URL",
+            "https://dashscope.aliyuncs.com/compatible-mode/v1",
+        ),
+        model_name=os.environ.get(
+            "EMBEDDING_MODEL_NAME",
+            "text-embedding-v4",
+        ),
+        dimensions=int(os.environ.get("EMBEDDING_DIMENSIONS", "1024")),
+        cache_enabled=(
+            os.environ.get("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+        ),
+    )
+
+
 class TimestampedDashScopeChatFormatter(DashScopeChatFormatter):
     """DashScope formatter that includes timestamp in formatted messages.
 
@@ -183,225 +333,249 @@ class TimestampedDashScopeChatFormatter(DashScopeChatFormatter):
             return textual_output[0], multimodal_data
         else:
             return (
-                "\n".join("- " + _ for _ in textual_output),
+                "- " + "\n- ".join(textual_output),
                 multimodal_data,
             )
 
-    # pylint: disable=too-many-statements,too-many-nested-blocks
-    async def _format(
+    def _promote_media(self, url: str, block: dict) -> list:
+        """Build the blocks promoting a tool result media file to the user.
+
+        Args:
+            url: Location of the media file
+            block: The media block from the tool result
+
+        Returns:
+            A caption and the media block, or an empty list if the block
+            type is not promoted
+        """
+        kind = block["type"]
+        flag = _PROMOTE_FLAGS.get(kind)
+        if flag is None or not getattr(self, flag):
+            return []
+        return [
+            _media_caption(kind, url),
+            {"type": kind, "source": {"type": "url", "url": url}},
+        ]
+
+    def _handle_text(self, block: dict, state: _MsgFormatState) -> None:
+        text_content = _truncate_text(block.get("text", ""), state.max_length)
+        state.content_blocks.append({"text": text_content})
+        state.token_count += safe_count_str_tokens(text_content)
+
+    def _handle_media(self, block: dict, state: _MsgFormatState) -> None:
+        state.content_blocks.append(
+            _format_dashscope_media_block(
+                block,  # type: ignore[arg-type]
+            ),
+        )
+        # Estimate fixed token cost for media
+        state.token_count += 100
+
+    def _handle_tool_use(self, block: dict, state: _MsgFormatState) -> None:
+        arguments_str = _dumps_tool_input(block.get("input", {}))
+        state.tool_calls.append(
+            {
+                "id": block.get("id"),
+                "type": "function",
+                "function": {
+                    "name": block.get("name"),
+                    "arguments": arguments_str,
+                },
+            },
+        )
+        state.token_count += safe_count_str_tokens(arguments_str)
+
+    def _handle_tool_result(
         self,
-        msgs: list[Msg],
-    ) -> list[dict[str, Any]]:
-        """Format message objects into DashScope API format with timestamps.
+        block: dict,
+        state: _MsgFormatState,
+    ) -> None:
+        (
+            textual_output,
+            multimodal_data,
+        ) = self.convert_tool_result_to_string(block["output"])
+
+        # Truncate tool result text
+        textual_output = _truncate_text(textual_output, state.max_length)
+        state.token_count += safe_count_str_tokens(textual_output)
+
+        # First add the tool result message in DashScope API format
+        state.entries.append(
+            {
+                "role": "tool",
+                "tool_call_id": block.get("id"),
+                "content": textual_output,
+                "name": block.get("name"),
+            },
+        )
 
-        Messages are processed in reverse order (newest first) and older
-        messages are skipped when token count exceeds memory_compact_threshold.
+        # Then, handle the multimodal data if any
+        promoted_blocks = [
+            promoted_block
+            for url, multimodal_block in multimodal_data
+            for promoted_block in self._promote_media(url, multimodal_block)
+        ]
+        if not promoted_blocks:
+            return
+
+        # Base64 media is saved to a new file on every pass, so results
+        # with promoted media are not cached
+        state.cacheable = False
+        # Format promoted blocks directly and add them as a user message
+        # (instead of inserting into msgs, which won't work in reverse
+        # iteration)
+        promoted_blocks = [
+            {
+                "type": "text",
+                "text": _SYSTEM_INFO_OPEN.format(block["name"]),
+            },
+            *promoted_blocks,
+            _SYSTEM_INFO_CLOSE,
+        ]
+        state.entries.append(
+            {
+                "role": "user",
+                "content": [
+                    {"text": promoted_block["text"]}
+                    if promoted_block["type"] == "text"
+                    else _format_dashscope_media_block(
+                        promoted_block,  # type: ignore[arg-type]
+                    )
+                    for promoted_block in promoted_blocks
+                ],
+            },
+        )
+
+    # Block type -> handler adding the block to the message format state
+    _BLOCK_HANDLERS = {
+        "text": _handle_text,
+        "image": _handle_media,
+        "audio": _handle_media,
+        "video": _handle_media,
+        "tool_use": _handle_tool_use,
+        "tool_result": _handle_tool_result,
+    }
+
+    def _format_msg(
+        self,
+        msg: Msg,
+        max_length: int,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any], int, bool]:
+        """Format a single message into DashScope API format.
 
         Args:
-            msgs (`list[Msg]`):
-                The list of message objects to format.
+            msg: The message to format
+            max_length: Maximum length of text and tool result content
 
         Returns:
-            `list[dict[str, Any]]`:
-                The formatted messages with  time_created fields.
+            Tuple of (tool result and promoted media entries in append
+            order, the formatted message, its token count, whether the
+            result may be cached)
         """
-        # Import required modules from parent implementation
+        state = _MsgFormatState(max_length=max_length)
+        handlers = self._BLOCK_HANDLERS
+        for block in msg.get_content_blocks():
+            typ = block.get("type")
+            handler = handlers.get(typ)
+            if handler is None:
+                logger.warning(
+                    "Unsupported block type %s in the message, skipped.",
+                    typ,
+                )
+                continue
+            handler(self, block, state)
 
-        self.assert_list_of_msgs(msgs)
+        msg_dashscope = {
+            "role": msg.role,
+            "content": state.content_blocks,
+            "time_created": msg.timestamp,  # Add timestamp here
+        }
 
-        formatted_msgs: list[dict] = []
-        total_token_count = 0
+        if state.tool_calls:
+            msg_dashscope["tool_calls"] = state.tool_calls
 
-        # Process messages in reverse order (newest first)
-        # Use index-based iteration to handle inserted messages
-        i = len(msgs) - 1
-        while i >= 0:
-            msg = msgs[i]
-            content_blocks: list[dict[str, Any]] = []
-            tool_calls = []
-            msg_token_count = 0
-
-            for block in msg.get_content_blocks():
-                typ = block.get("type")
-
-                if typ == "text":
-                    text_content = _truncate_text(block.get("text", ""))
-                    content_blocks.append({"text": text_content})
-                    msg_token_count += safe_count_str_tokens(text_content)
-
-                elif typ in ["image", "audio", "video"]:
-                    content_blocks.append(
-                        _format_dashscope_media_block(
-                            block,  # type: ignore[arg-type]
-                        ),
-                    )
-                    # Estimate fixed token cost for media
-                    msg_token_count += 100
+        return state.entries, msg_dashscope, state.token_count, state.cacheable
 
-                elif typ == "tool_use":
-                    arguments_str = json.dumps(
-                        block.get("input", {}),
-                        ensure_ascii=False,
-                    )
-                    tool_calls.append(
-                        {
-                            "id": block.get("id"),
-                            "type": "function",
-                            "function": {
-                                "name": block.get("name"),
-                                "arguments": arguments_str,
-                            },
-                        },
-                    )
-                    msg_token_count += safe_count_str_tokens(arguments_str)
-
-                elif typ == "tool_result":
-                    (
-                        textual_output,
-                        multimodal_data,
-                    ) = self.convert_tool_result_to_string(block["output"])
-
-                    # Truncate tool result text
-                    textual_output = _truncate_text(textual_output)
-                    msg_token_count += safe_count_str_tokens(textual_output)
-
-                    # First add the tool result message in DashScope API format
-                    formatted_msgs.append(
-                        {
-                            "role": "tool",
-                            "tool_call_id": block.get("id"),
-                            "content": textual_output,
-                            "name": block.get("name"),
-                        },
-                    )
+    def _format_msg_cached(
+        self,
+        msg: Msg,
+        max_length: int,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any], int]:
+        """Format a single message, reusing earlier results.
 
-                    # Then, handle the multimodal data if any
-                    promoted_blocks: list = []
-                    for url, multimodal_block in multimodal_data:
-                        if (
-                            multimodal_block["type"] == "image"
-                            and self.promote_tool_result_images
-                        ):
-                            promoted_blocks.extend(
-                                [
-                                    TextBlock(
-                                        type="text",
-                                        text=f"\n- The image from '{url}': ",
-                                    ),
-                                    ImageBlock(
-                                        type="image",
-                                        source=URLSource(
-                                            type="url",
-                                            url=url,
-                                        ),
-                                    ),
-                                ],
-                            )
-                        elif (
-                            multimodal_block["type"] == "audio"
-                            and self.promote_tool_result_audios
-                        ):
-                            promoted_blocks.extend(
-                                [
-                                    TextBlock(
-                                        type="text",
-                                        text=f"\n- The audio from '{url}': ",
-                                    ),
-                                    AudioBlock(
-                                        type="audio",
-                                        source=URLSource(
-                                            type="url",
-                                            url=url,
-                                        ),
-                                    ),
-                                ],
-                            )
-                        elif (
-                            multimodal_block["type"] == "video"
-                            and self.promote_tool_result_videos
-                        ):
-                            promoted_blocks.extend(
-                                [
-                                    TextBlock(
-                                        type="text",
-                                        text=f"\n- The video from '{url}': ",
-                                    ),
-                                    VideoBlock(
-                                        type="video",
-                                        source=URLSource(
-                                            type="url",
-                                            url=url,
-                                        ),
-                                    ),
-                                ],
-                            )
-
-                    if promoted_blocks:
-                        # Format promoted blocks directly
-                        # and add to formatted_msgs
-                        # (instead of inserting into msgs,
-                        # which won't work in reverse iteration)
-                        promoted_blocks = [
-                            TextBlock(
-                                type="text",
-                                text="<system-info>The following are "
-                                f"the media contents from the tool "
-                                f"result of '{block['name']}':",
-                            ),
-                            *promoted_blocks,
-                            TextBlock(
-                                type="text",
-                                text="</system-info>",
-                            ),
-                        ]
-
-                        # Format the promoted blocks directly
-                        promoted_content_blocks: list[dict[str, Any]] = []
-                        for promoted_block in promoted_blocks:
-                            promoted_block_dict = (
-                                promoted_block
-                                if isinstance(promoted_block, dict)
-                                else promoted_block.model_dump()
-                            )
-                            promoted_typ = promoted_block_dict.get("type")
-                            if promoted_typ == "text":
-                                promoted_content_blocks.append(
-                                    {
-                                        "text": promoted_block_dict.get(
-                                            "text",
-                                            "",
-                                        ),
-                                    },
-                                )
-                            elif promoted_typ in ["image", "audio", "video"]:
-                                promoted_content_blocks.append(
-                                    _format_dashscope_media_block(
-                                        promoted_block_dict,
-                                    ),
-                                )
-
-                        # Add the promoted user message to formatted_msgs
-                        formatted_msgs.append(
-                            {
-                                "role": "user",
-                                "content": promoted_content_blocks,
-                            },
-                        )
+        Results are keyed by message id, timestamp and a signature of the
+        content, so messages edited in place (e.g. truncated tool results)
+        are formatted again. The returned dicts are shallow copies, since
+        ``_reformat_messages`` replaces their ``content`` field.
 
-                else:
-                    logger.warning(
-                        "Unsupported block type %s in the message, skipped.",
-                        typ,
-                    )
+        Args:
+            msg: The message to format
+            max_length: Maximum length of text and tool result content
 
-            msg_dashscope = {
-                "role": msg.role,
-                "content": content_blocks,
-                "time_created": msg.timestamp,  # Add timestamp here
-            }
+        Returns:
+            Tuple of (tool result entries, the formatted message, its
+            token count)
+        """
+        key = (
+            msg.id,
+            msg.timestamp,
+            max_length,
+            self.promote_tool_result_images,
+            self.promote_tool_result_audios,
+            self.promote_tool_result_videos,
+            _content_signature(msg.content),
+        )
+        with _FORMAT_CACHE_LOCK:
+            cached = _FORMAT_CACHE.get(key)
+            if cached is not None:
+                _FORMAT_CACHE.move_to_end(key)
+
+        if cached is None:
+            (
+                entries,
+                msg_dashscope,
+                msg_token_count,
+                cacheable,
+            ) = self._format_msg(msg, max_length)
+            if not cacheable:
+                return entries, msg_dashscope, msg_token_count
+            cached = (entries, msg_dashscope, msg_token_count)
+            with _FORMAT_CACHE_LOCK:
+                _FORMAT_CACHE[key] = cached
+                if len(_FORMAT_CACHE) > _FORMAT_CACHE_SIZE:
+                    _FORMAT_CACHE.popitem(last=False)
+
+        entries, msg_dashscope, msg_token_count = cached
+        return (
+            [dict(entry) for entry in entries],
+            dict(msg_dashscope),
+            msg_token_count,
+        )
+
+    def _format_msgs(
+        self,
+        msgs: list[Msg],
+        max_length: int,
+    ) -> list[dict[str, Any]]:
+        """Format messages newest first until the token budget is used up.
+
+        Args:
+            msgs: The messages to format
+            max_length: Maximum length of text and tool result content
+
+        Returns:
+            The formatted messages in chronological order
+        """
+        formatted_msgs: list[dict] = []
+        total_token_count = 0
 
-            if tool_calls:
-                msg_dashscope["tool_calls"] = tool_calls
+        # Process messages in reverse order (newest first)
+        for msg in reversed(msgs):
+            entries, msg_dashscope, msg_token_count = self._format_msg_cached(
+                msg,
+                max_length,
+            )
+            formatted_msgs.extend(entries)
 
             total_token_count += msg_token_count
             # Check if adding this message would exceed threshold
@@ -420,15 +594,88 @@ class TimestampedDashScopeChatFormatter(DashScopeChatFormatter):
 
             formatted_msgs.append(msg_dashscope)
 
-            # Move to previous message
-            i -= 1
-
         # Reverse to restore chronological order
         formatted_msgs.reverse()
+        return formatted_msgs
+
+    async def _format(
+        self,
+        msgs: list[Msg],
+    ) -> list[dict[str, Any]]:
+        """Format message objects into DashScope API format with timestamps.
+
+        Messages are processed in reverse order (newest first) and older
+        messages are skipped when token count exceeds memory_compact_threshold.
+        Long lists are formatted in a worker thread so tokenization does
+        not block the event loop. The input messages are not modified, so
+        one formatter instance can serve concurrent calls.
+
+        Args:
+            msgs (`list[Msg]`):
+                The list of message objects to format.
+
+        Returns:
+            `list[dict[str, Any]]`:
+                The formatted messages with  time_created fields.
+        """
+        self.assert_list_of_msgs(msgs)
+
+        max_length = int(
+            os.environ.get(
+                "MAX_FORMATTER_TEXT_LENGTH",
+                _DEFAULT_MAX_FORMATTER_TEXT_LENGTH,
+            ),
+        )
+        if len(msgs) > _FORMAT_OFFLOAD_MIN_MSGS:
+            formatted_msgs = await asyncio.to_thread(
+                self._format_msgs,
+                msgs,
+                max_length,
+            )
+        else:
+            formatted_msgs = self._format_msgs(msgs, max_length)
 
         return _reformat_messages(formatted_msgs)
 
 
+def _read_lines(file_path: Path, offset: int, limit: int) -> str | None:
+    """Read ``limit`` lines starting at line ``offset`` (1-indexed).
+
+    Stops reading as soon as the requested lines are collected. Lines are
+    counted as when splitting the whole content on newlines, so a trailing
+    newline is followed by an empty last line.
+
+    Args:
+        file_path: The file to read
+        offset: First line to return, 1-indexed
+        limit: Maximum number of lines to return
+
+    Returns:
+        The selected lines joined by newlines, or None if the file has
+        fewer than ``offset`` lines
+    """
+    selected: list[str] = []
+    line_count = 0
+    ends_with_newline = True
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line_count += 1
+            ends_with_newline = line.endswith("\n")
+            if line_count >= offset:
+                selected.append(line[:-1] if ends_with_newline else line)
+                if len(selected) == limit:
+                    return "\n".join(selected)
+
+    if ends_with_newline:
+        # The empty segment after the final newline
+        line_count += 1
+        if line_count >= offset:
+            selected.append("")
+    if line_count < offset:
+        return None
+    return "\n".join(selected)
+
+
 # Try to import reme, log warning if it fails
 try:
     from reme import ReMeFb
@@ -453,9 +700,21 @@ class MemoryManager(ReMeFb):
         self,
         *args,
         working_dir: str,
+        max_concurrent_summaries: int | None = None,
+        max_pending_summaries: int = 16,
         **kwargs,
     ):
-        """Initialize MemoryManager with ReMeFs configuration."""
+        """Initialize MemoryManager with ReMeFs configuration.
+
+        Args:
+            working_dir: Working directory for memory files
+            max_concurrent_summaries: Maximum number of background summary
+                tasks running at once, defaults to env
+                SUMMARY_MAX_CONCURRENCY or 4
+            max_pending_summaries: Maximum number of background summary
+                tasks queued or running; new tasks wait for older ones
+                beyond this
+        """
         if not _REME_AVAILABLE:
             raise RuntimeError("reme package not installed.")
 
@@ -479,6 +738,7 @@ class MemoryManager(ReMeFb):
         ) = self.get_emb_envs()
 
         vector_enabled = bool(embedding_api_key)
+        self._vector_enabled = vector_enabled
         if vector_enabled:
             logger.info("Vector search enabled.")
         else:
@@ -490,6 +750,11 @@ class MemoryManager(ReMeFb):
             )
         fts_enabled = os.environ.get("FTS_ENABLED", "true").lower() == "true"
         working_path: Path = Path(working_dir)
+        self._memory_paths: list[Path] = [
+            working_path / "MEMORY.md",
+            working_path / "memory.md",
+            working_path / "memory",
+        ]
 
         # Determine memory backend: use MEMORY_STORE_BACKEND env var,
         # default "auto" selects based on platform
@@ -524,11 +789,7 @@ class MemoryManager(ReMeFb):
                 "fts_enabled": fts_enabled,
             },
             default_file_watcher_config={
-                "watch_paths": [
-                    str(working_path / "MEMORY.md"),
-                    str(working_path / "memory.md"),
-                    str(working_path / "memory"),
-                ],
+                "watch_paths": [str(path) for path in self._memory_paths],
             },
             **kwargs,
         )
@@ -541,7 +802,52 @@ class MemoryManager(ReMeFb):
         else:
             self.language = ""
 
-        self.summary_tasks: list[asyncio.Task] = []
+        if max_concurrent_summaries is None:
+            max_concurrent_summaries = int(
+                os.environ.get("SUMMARY_MAX_CONCURRENCY", "4"),
+            )
+        self.max_concurrent_summaries = max(1, max_concurrent_summaries)
+        self.max_pending_summaries = max(
+            self.max_concurrent_summaries,
+            max_pending_summaries,
+        )
+        self._summary_sem = asyncio.Semaphore(self.max_concurrent_summaries)
+        self.summary_tasks: set[asyncio.Task] = set()
+
+        # Results of recent memory_search calls, dropped whenever a memory
+        # file changes or the embedding model is reconfigured
+        self._search_cache = MemorySearchCache(maxsize=512)
+
+        # Optional cache matching paraphrased queries by embedding
+        # similarity; needs vector search for query embeddings
+        self._semantic_cache: SemanticQueryCache | None = None
+        semantic_cache_enabled = (
+            os.environ.get("SEMANTIC_QUERY_CACHE", "false").lower() == "true"
+        )
+        if semantic_cache_enabled and vector_enabled and NUMPY_AVAILABLE:
+            self._semantic_cache = SemanticQueryCache(
+                maxsize=2048,
+                threshold=float(
+                    os.environ.get("SEMANTIC_CACHE_THRESHOLD", "0.95"),
+                ),
+                ttl=float(os.environ.get("SEMANTIC_CACHE_TTL", "0")),
+            )
+            logger.info("Semantic query cache enabled.")
+
+        # Optional on-disk store of search results surviving restarts
+        self._persistent_cache: PersistentQueryCache | None = None
+        persistent_cache_enabled = (
+            os.environ.get("PERSISTENT_QUERY_CACHE", "false").lower() == "true"
+        )
+        if persistent_cache_enabled:
+            try:
+                self._persistent_cache = PersistentQueryCache(
+                    working_path / ".copaw_qcache.sqlite",
+                    ttl_days=float(os.environ.get("CACHE_TTL_DAYS", "30")),
+                )
+                logger.info("Persistent query cache enabled.")
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to open persistent query cache: {e}")
 
         self.toolkit = Toolkit()
         self.toolkit.register_tool_function(read_file)
@@ -551,39 +857,48 @@ class MemoryManager(ReMeFb):
         self.chat_model: ChatModelBase | None = None
         self.formatter: FormatterBase | None = None
 
-    @staticmethod
-    def get_emb_envs():
-        embedding_api_key = os.environ.get("EMBEDDING_API_KEY", "")
-        embedding_base_url = os.environ.get(
-            "EMBEDDING_BASE_URL",
-            "https://dashscope.aliyuncs.com/compatible-mode/v1",
-        )
-        embedding_model_name = os.environ.get(
-            "EMBEDDING_MODEL_NAME",
-            "text-embedding-v4",
-        )
-        embedding_dimensions = int(
-            os.environ.get("EMBEDDING_DIMENSIONS", "1024"),
-        )
-        embedding_cache_enabled = (
-            os.environ.get("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
-        )
-        return (
-            embedding_api_key,
-            embedding_base_url,
-            embedding_model_name,
-            embedding_dimensions,
-            embedding_cache_enabled,
+        # Last (messages, formatted) pair; compaction and the background
+        # summary usually format the very same message list.
+        self._formatted_cache: tuple[list[Msg], list[dict]] | None = None
+        # The formatter does not modify its input or keep per-call state,
+        # so one instance is shared by all compaction and summary calls
+        self._ts_formatter = TimestampedDashScopeChatFormatter(
+            memory_compact_threshold=self._memory_compact_threshold,
         )
 
+        # Idle summary agents, see _borrow_agent
+        self._agent_pool: dict[tuple[str, str, bool], list[ReActAgent]] = {}
+
+        # Embedding settings last applied by update_emb_envs
+        self._applied_emb_envs: EmbeddingEnvs | None = None
+
+    @staticmethod
+    def get_emb_envs() -> EmbeddingEnvs:
+        """Get the embedding settings from the environment.
+
+        The settings are read once and reused until env vars are changed
+        through ``copaw.envs`` or ``reload_emb_envs`` is called.
+        """
+        return _load_emb_envs(get_environ_version())
+
+    @staticmethod
+    def reload_emb_envs() -> None:
+        """Re-read the embedding settings on the next access."""
+        _load_emb_envs.cache_clear()
+
     def update_emb_envs(self):
+        emb_envs = self.get_emb_envs()
+        if emb_envs is self._applied_emb_envs:
+            return
+        self._applied_emb_envs = emb_envs
+
         (
             embedding_api_key,
             embedding_base_url,
             embedding_model_name,
             embedding_dimensions,
             embedding_cache_enabled,
-        ) = self.get_emb_envs()
+        ) = emb_envs
 
         if embedding_api_key:
             os.environ["REME_EMBEDDING_API_KEY"] = embedding_api_key
@@ -591,9 +906,19 @@ class MemoryManager(ReMeFb):
         if embedding_base_url:
             os.environ["REME_EMBEDDING_BASE_URL"] = embedding_base_url
 
-        self.default_embedding_model.model_name = embedding_model_name
-        self.default_embedding_model.dimensions = embedding_dimensions
-        self.default_embedding_model.enable_cache = embedding_cache_enabled
+        model = self.default_embedding_model
+        if (
+            model.model_name != embedding_model_name
+            or model.dimensions != embedding_dimensions
+        ):
+            self._search_cache.clear()
+            if self._semantic_cache is not None:
+                self._semantic_cache.clear()
+            model.model_name = embedding_model_name
+            model.dimensions = embedding_dimensions
+
+        if model.enable_cache != embedding_cache_enabled:
+            model.enable_cache = embedding_cache_enabled
 
     async def start(self):
         """Start the memory manager and initialize services."""
@@ -605,12 +930,112 @@ class MemoryManager(ReMeFb):
 
     async def close(self):
         """Close the memory manager and cleanup resources."""
+        if self._persistent_cache is not None:
+            self._persistent_cache.close()
+            self._persistent_cache = None
         try:
             return await super().close()
         except Exception as e:
             logger.exception(f"Failed to close memory manager: {e}")
             raise
 
+    async def _format_messages(self, messages: list[Msg]) -> list[dict]:
+        """Format messages for compaction/summary prompts.
+
+        Reuses the previous result when called again with the same list
+        object, so a list passed to both ``compact_memory`` and
+        ``summary_memory`` is only formatted once.
+        """
+        cache = self._formatted_cache
+        if cache is not None and cache[0] is messages:
+            return cache[1]
+
+        formatted = await self._ts_formatter.format(messages)
+        self._formatted_cache = (messages, formatted)
+        return formatted
+
+    @contextlib.asynccontextmanager
+    async def _borrow_agent(
+        self,
+        name: str,
+        sys_prompt: str,
+        use_toolkit: bool = False,
+    ) -> AsyncIterator[ReActAgent]:
+        """Borrow an idle summary agent, creating one if none is free.
+
+        Agents are pooled per (name, system prompt) and returned with a
+        cleared memory, so concurrent calls never share an agent. Pools
+        for an outdated system prompt of the same name are dropped, as are
+        agents built for a previous chat model or formatter.
+
+        Args:
+            name: Agent name
+            sys_prompt: System prompt for the agent
+            use_toolkit: Whether the agent gets the memory file tools
+        """
+        key = (
+            name,
+            hashlib.blake2b(sys_prompt.encode(), digest_size=8).hexdigest(),
+            use_toolkit,
+        )
+        pool = self._agent_pool.get(key)
+        agent = pool.pop() if pool else None
+        if (
+            agent is None
+            or agent.model is not self.chat_model
+            or agent.formatter is not self.formatter
+        ):
+            agent = ReActAgent(
+                name=name,
+                model=self.chat_model,
+                sys_prompt=sys_prompt,
+                formatter=self.formatter,
+                toolkit=self.toolkit if use_toolkit else None,
+            )
+
+        try:
+            yield agent
+        finally:
+            await agent.memory.clear()
+            if key not in self._agent_pool:
+                for stale_key in [k for k in self._agent_pool if k[0] == name]:
+                    del self._agent_pool[stale_key]
+            self._agent_pool.setdefault(key, []).append(agent)
+
+    async def _run_compact_agent(
+        self,
+        name: str,
+        sys_prompt: str,
+        content: str,
+    ) -> str:
+        """Run a one-shot summary agent on a compaction prompt.
+
+        Args:
+            name: Agent name, also used in error logs
+            sys_prompt: System prompt for the agent
+            content: User prompt; nothing is run if empty
+
+        Returns:
+            Summary text, or "" if content is empty or the call failed
+        """
+        if not content:
+            return ""
+
+        try:
+            async with self._borrow_agent(name, sys_prompt) as agent:
+                summary_msg: Msg = await agent.reply(
+                    Msg(
+                        name="reme",
+                        content=content,
+                        role="user",
+                    ),
+                )
+
+            return summary_msg.get_text_content()
+        except Exception as e:
+            logger.exception(f"Failed to generate {name}: {e}")
+            return ""
+
     async def compact_memory(
         self,
         messages_to_summarize: list[Msg] | None = None,
@@ -619,8 +1044,13 @@ class MemoryManager(ReMeFb):
     ) -> str:
         """Compact messages into a summary.
 
+        Compaction is incremental: callers pass only the messages not yet
+        marked as compressed, and the summary of everything compressed
+        before is carried over through ``previous_summary``.
+
         Args:
-            messages_to_summarize: Messages to summarize
+            messages_to_summarize: Messages to summarize, i.e. the ones
+                newer than what ``previous_summary`` already covers
             turn_prefix_messages: Messages to prepend to each turn
             previous_summary: Previous summary to build upon
 
@@ -629,21 +1059,20 @@ class MemoryManager(ReMeFb):
         """
         self.update_emb_envs()
 
-        formatter = TimestampedDashScopeChatFormatter(
-            memory_compact_threshold=self._memory_compact_threshold,
-        )
         if not messages_to_summarize and not turn_prefix_messages:
             return ""
 
         if messages_to_summarize:
-            messages_to_summarize = await formatter.format(
+            messages_to_summarize = await self._format_messages(
                 messages_to_summarize,
             )
         else:
             messages_to_summarize = []
 
         if turn_prefix_messages:
-            turn_prefix_messages = await formatter.format(turn_prefix_messages)
+            turn_prefix_messages = await self._format_messages(
+                turn_prefix_messages,
+            )
         else:
             turn_prefix_messages = []
 
@@ -666,59 +1095,19 @@ class MemoryManager(ReMeFb):
         history_user = prompt_dict.get("history_user", "")
         turn_prefix_user = prompt_dict.get("turn_prefix_user", "")
 
-        if history_user:
-            try:
-                agent = ReActAgent(
-                    name="history_summary",
-                    model=self.chat_model,
-                    sys_prompt=system_prompt,
-                    formatter=self.formatter,
-                )
-
-                history_summary_msg: Msg = await agent.reply(
-                    Msg(
-                        name="reme",
-                        content=history_user,
-                        role="user",
-                    ),
-                )
-
-                history_summary: str = history_summary_msg.get_text_content()
-            except Exception as e:
-                logger.exception(f"Failed to generate history summary: {e}")
-                history_summary = ""
-
-        else:
-            history_summary = ""
-
-        if turn_prefix_user:
-            try:
-                agent = ReActAgent(
-                    name="turn_prefix_summary",
-                    model=self.chat_model,
-                    sys_prompt=system_prompt,
-                    formatter=self.formatter,
-                )
-
-                turn_prefix_summary_msg: Msg = await agent.reply(
-                    Msg(
-                        name="reme",
-                        content=turn_prefix_user,
-                        role="user",
-                    ),
-                )
-
-                turn_prefix_summary: str = (
-                    turn_prefix_summary_msg.get_text_content()
-                )
-            except Exception as e:
-                logger.exception(
-                    f"Failed to generate turn prefix summary: {e}",
-                )
-                turn_prefix_summary = ""
-
-        else:
-            turn_prefix_summary = ""
+        # The two summaries are independent LLM calls, run them together
+        history_summary, turn_prefix_summary = await asyncio.gather(
+            self._run_compact_agent(
+                name="history_summary",
+                sys_prompt=system_prompt,
+                content=history_user,
+            ),
+            self._run_compact_agent(
+                name="turn_prefix_summary",
+                sys_prompt=system_prompt,
+                content=turn_prefix_user,
+            ),
+        )
 
         return "\n".join(
             [x for x in [history_summary, turn_prefix_summary] if x.strip()],
@@ -733,10 +1122,7 @@ class MemoryManager(ReMeFb):
         """Generate a summary of the given messages."""
         self.update_emb_envs()
 
-        formatter = TimestampedDashScopeChatFormatter(
-            memory_compact_threshold=self._memory_compact_threshold,
-        )
-        messages = await formatter.format(messages)
+        messages = await self._format_messages(messages)
 
         try:
             result: dict = await super().summary(
@@ -754,21 +1140,18 @@ class MemoryManager(ReMeFb):
         logger.info(f"Memory Summary Prompt:\n{prompt}")
 
         try:
-            agent = ReActAgent(
-                name="summary_memory",
-                sys_prompt="You are a helpful assistant.",
-                model=self.chat_model,
-                formatter=self.formatter,
-                toolkit=self.toolkit,
-            )
-
-            summary_msg: Msg = await agent.reply(
-                Msg(
-                    name="reme",
-                    content=prompt,
-                    role="user",
-                ),
-            )
+            async with self._borrow_agent(
+                "summary_memory",
+                "You are a helpful assistant.",
+                use_toolkit=True,
+            ) as agent:
+                summary_msg: Msg = await agent.reply(
+                    Msg(
+                        name="reme",
+                        content=prompt,
+                        role="user",
+                    ),
+                )
 
             history_summary: str = summary_msg.get_text_content()
             logger.info(f"Memory Summary Result:\n{history_summary}")
@@ -777,57 +1160,71 @@ class MemoryManager(ReMeFb):
             logger.exception(f"Failed to generate memory summary: {e}")
             return ""
 
-    async def await_summary_tasks(self) -> str:
-        """Wait for all summary tasks to complete."""
-        result = ""
-        for task in self.summary_tasks:
-            if task.done():
-                exc = task.exception()
-                if exc is not None:
-                    logger.exception(f"Summary task failed: {exc}")
-                    result += f"Summary task failed: {exc}\n"
+    def _finish_summary_task(self, task: asyncio.Task) -> str:
+        """Log a finished summary task and stop tracking it.
 
-                else:
-                    result = task.result()
-                    logger.info(f"Summary task completed: {result}")
-                    result += f"Summary task completed: {result}\n"
+        Args:
+            task: A done summary task
+
+        Returns:
+            One-line report of the task outcome
+        """
+        self.summary_tasks.discard(task)
+        exc = task.exception()
+        if exc is not None:
+            logger.exception(f"Summary task failed: {exc}")
+            return f"Summary task failed: {exc}\n"
+
+        task_result = task.result()
+        logger.info(f"Summary task completed: {task_result}")
+        return f"Summary task completed: {task_result}\n"
 
-            else:
-                try:
-                    result = await task
-                    logger.info(f"Summary task completed: {result}")
-                    result += f"Summary task completed: {result}\n"
+    async def await_summary_tasks(self) -> str:
+        """Wait for all summary tasks to complete.
+
+        Tasks are reported in completion order and released as soon as
+        they finish.
+        """
+        parts: list[str] = []
+        pending = set(self.summary_tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                parts.append(self._finish_summary_task(task))
+        return "".join(parts)
 
-                except Exception as e:
-                    logger.exception(f"Summary task failed: {e}")
-                    result += f"Summary task failed: {e}\n"
+    async def _enforce_backlog(self) -> None:
+        """Wait until fewer than max_pending_summaries tasks are in flight.
 
-        self.summary_tasks.clear()
-        return result
+        Keeps fast producers (e.g. repeated /compact) from piling up LLM
+        calls and the message lists they hold on to.
+        """
+        while len(self.summary_tasks) >= self.max_pending_summaries:
+            done, _ = await asyncio.wait(
+                self.summary_tasks,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                self._finish_summary_task(task)
 
-    def add_async_summary_task(
+    async def add_async_summary_task(
         self,
         messages: list[Msg],
         date: str = "",
         version: str = "default",
     ):
-        # Clean up completed summary tasks
-        remaining_tasks = []
-        for task in self.summary_tasks:
-            if task.done():
-                exc = task.exception()
-                if exc is not None:
-                    logger.exception(f"Summary task failed: {exc}")
-                else:
-                    result = task.result()
-                    logger.info(f"Summary task completed: {result}")
-            else:
-                remaining_tasks.append(task)
-        self.summary_tasks = remaining_tasks
+        # Clean up completed summary tasks so their results are released
+        for task in [t for t in self.summary_tasks if t.done()]:
+            self._finish_summary_task(task)
+
+        await self._enforce_backlog()
 
-        self.summary_tasks.append(
+        self.summary_tasks.add(
             asyncio.create_task(
-                self.summary_memory(
+                self._bounded_summary_memory(
                     messages=messages,
                     date=date or datetime.datetime.now().strftime("%Y-%m-%d"),
                     version=version,
@@ -835,6 +1232,158 @@ class MemoryManager(ReMeFb):
             ),
         )
 
+    async def _bounded_summary_memory(
+        self,
+        messages: list[Msg],
+        date: str,
+        version: str,
+    ) -> str:
+        """Run summary_memory once a concurrency slot is free."""
+        async with self._summary_sem:
+            return await self.summary_memory(
+                messages=messages,
+                date=date,
+                version=version,
+            )
+
+    async def _get_query_embedding(self, query: str) -> list[float]:
+        """Embed a search query, returning an empty list on failure.
+
+        The embedding model caches its results, so the vector search that
+        may follow does not embed the query again.
+        """
+        try:
+            return await self.default_embedding_model.get_embedding(query)
+        except Exception as e:
+            logger.warning(f"Failed to embed memory search query: {e}")
+            return []
+
+    @staticmethod
+    def _clamp_search_params(
+        max_results: int,
+        min_score: float,
+    ) -> tuple[int, float]:
+        """Clamp memory search parameters to their valid ranges.
+
+        Any value convertible to a number is accepted (e.g. numpy scalars
+        or numeric strings from tool calls); others fall back to the
+        defaults.
+        """
+        try:
+            max_results = min(max(int(max_results), 1), 100)
+        except (TypeError, ValueError, OverflowError):
+            max_results = 5
+
+        try:
+            min_score = float(min_score)
+        except (TypeError, ValueError):
+            min_score = 0.1
+        if math.isnan(min_score):
+            min_score = 0.1
+        min_score = min(max(min_score, 0.001), 0.999)
+        return max_results, min_score
+
+    def _validate_search_caches(self) -> None:
+        """Drop cached search results if a memory file changed."""
+        files_changed = self._search_cache.validate(self._memory_paths)
+        if not files_changed:
+            return
+
+        if self._persistent_cache is not None:
+            self._persistent_cache.invalidate(self._search_cache.fingerprint)
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
+            if self._persistent_cache is not None:
+                # Warm up with queries from earlier runs on the same files,
+                # least recently used first
+                entries = self._persistent_cache.recent_embeddings(
+                    self._search_cache.fingerprint,
+                    self._semantic_cache.maxsize,
+                )
+                for params_key, embedding, result in reversed(entries):
+                    self._semantic_cache.put(params_key, embedding, result)
+
+    async def _cached_search(
+        self,
+        query: str,
+        max_results: int,
+        min_score: float,
+        query_embedding: list[float] | None = None,
+    ) -> str:
+        """Search memory, consulting the result caches first.
+
+        Args:
+            query: The search query
+            max_results: Max search results to return
+            min_score: Min similarity score for results
+            query_embedding: Embedding of the query if already computed
+
+        Returns:
+            Search results as formatted string
+        """
+        params_key = (
+            self.default_embedding_model.model_name,
+            self.default_embedding_model.dimensions,
+            max_results,
+            min_score,
+        )
+        cache_key = (*params_key, query)
+        search_result = self._search_cache.get(cache_key)
+        if search_result is not None:
+            return search_result
+
+        files = self._search_cache.fingerprint
+        if self._persistent_cache is not None and files is not None:
+            search_result = self._persistent_cache.get(
+                params_key,
+                query,
+                files,
+            )
+            if search_result is not None:
+                self._search_cache.put(cache_key, search_result)
+                return search_result
+
+        if self._semantic_cache is not None:
+            if not query_embedding:
+                query_embedding = await self._get_query_embedding(query)
+            if query_embedding:
+                search_result = self._semantic_cache.get(
+                    params_key,
+                    query_embedding,
+                )
+
+        if search_result is None:
+            search_result = await super().memory_search(
+                query=query,
+                max_results=max_results,
+                min_score=min_score,
+            )
+            if (
+                query_embedding
+                and self._semantic_cache is not None
+                and self._search_cache.is_settled()
+            ):
+                self._semantic_cache.put(
+                    params_key,
+                    query_embedding,
+                    search_result,
+                )
+
+        self._search_cache.put(cache_key, search_result)
+        if (
+            self._persistent_cache is not None
+            and files is not None
+            and self._search_cache.is_settled()
+        ):
+            self._persistent_cache.put(
+                params_key,
+                query,
+                files,
+                search_result,
+                embedding=query_embedding,
+            )
+        return search_result
+
     async def memory_search(
         self,
         query: str,
@@ -865,21 +1414,17 @@ class MemoryManager(ReMeFb):
                 ],
             )
 
-        if isinstance(max_results, int):
-            max_results = min(max(max_results, 1), 100)
-        else:
-            max_results = 5
-
-        if isinstance(min_score, float):
-            min_score = min(max(min_score, 0.001), 0.999)
-        else:
-            min_score = 0.1
-
-        search_result: str = await super().memory_search(
-            query=query,
-            max_results=max_results,
-            min_score=min_score,
+        max_results, min_score = self._clamp_search_params(
+            max_results,
+            min_score,
+        )
+        self._validate_search_caches()
+        search_result = await self._cached_search(
+            query,
+            max_results,
+            min_score,
         )
+
         return ToolResponse(
             content=[
                 TextBlock(
@@ -889,6 +1434,126 @@ class MemoryManager(ReMeFb):
             ],
         )
 
+    async def memory_search_batch(
+        self,
+        queries: list[str],
+        max_results: int = 5,
+        min_score: float = 0.1,
+    ) -> list[ToolResponse]:
+        """Search memory for several queries at once.
+
+        Queries missing from the result caches are embedded with a single
+        batched embedding request when the vectors can be reused, i.e. for
+        the semantic cache or through the embedding model's own cache,
+        and then searched concurrently.
+
+        Args:
+            queries: The semantic search queries
+            max_results: Max search results to return per query
+            min_score: Min similarity score for results
+
+        Returns:
+            One search response per query, in the order of ``queries``
+        """
+        max_results, min_score = self._clamp_search_params(
+            max_results,
+            min_score,
+        )
+        self._validate_search_caches()
+
+        unique_queries = list(
+            dict.fromkeys(query for query in queries if query)
+        )
+        params_key = (
+            self.default_embedding_model.model_name,
+            self.default_embedding_model.dimensions,
+            max_results,
+            min_score,
+        )
+        files = self._search_cache.fingerprint
+        pending: list[str] = []
+        for query in unique_queries:
+            cache_key = (*params_key, query)
+            if self._search_cache.get(cache_key) is not None:
+                continue
+            if self._persistent_cache is not None and files is not None:
+                search_result = self._persistent_cache.get(
+                    params_key,
+                    query,
+                    files,
+                )
+                if search_result is not None:
+                    self._search_cache.put(cache_key, search_result)
+                    continue
+            pending.append(query)
+
+        # Without the semantic cache or an embedding cache, the searches
+        # below would embed each query again and a batch only adds a call
+        reuse_embeddings = self._semantic_cache is not None or bool(
+            getattr(self.default_embedding_model, "enable_cache", False),
+        )
+        embeddings: dict[str, list[float]] = {}
+        if len(pending) > 1 and self._vector_enabled and reuse_embeddings:
+            try:
+                vectors = await self.default_embedding_model.get_embeddings(
+                    pending,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to embed memory search queries: {e}")
+                vectors = []
+            # Failed embeddings are dropped from the result, so positions
+            # only line up when every query was embedded
+            if len(vectors) == len(pending):
+                embeddings = dict(zip(pending, vectors))
+
+        search_results = await asyncio.gather(
+            *(
+                self._cached_search(
+                    query,
+                    max_results,
+                    min_score,
+                    embeddings.get(query),
+                )
+                for query in unique_queries
+            ),
+        )
+        results = dict(zip(unique_queries, search_results))
+
+        return [
+            ToolResponse(
+                content=[
+                    TextBlock(
+                        type="text",
+                        text=results[query]
+                        if query
+                        else "Error: No query provided.",
+                    ),
+                ],
+            )
+            for query in queries
+        ]
+
+    def _resolve_memory_file(self, path: str) -> Path | None:
+        """Resolve a memory file path inside the working directory.
+
+        Args:
+            path: Path to the memory file (relative or absolute)
+
+        Returns:
+            The absolute path of a regular ``.md`` file under the working
+            directory, or None if the path does not point to one
+        """
+        working_dir = os.path.abspath(self.working_dir)
+        abs_path = os.path.abspath(os.path.join(working_dir, path.strip()))
+        if not abs_path.lower().endswith(".md"):
+            return None
+        if os.path.commonpath([working_dir, abs_path]) != working_dir:
+            return None
+        file_path = Path(abs_path)
+        if file_path.is_symlink() or not file_path.is_file():
+            return None
+        return file_path
+
     async def memory_get(
         self,
         path: str,
@@ -908,11 +1573,28 @@ class MemoryManager(ReMeFb):
         Returns:
             Memory file content as string
         """
-        get_result = await super().memory_get(
-            path=path,
-            offset=offset,
-            limit=limit,
-        )
+        get_result = None
+        if (
+            isinstance(offset, int)
+            and isinstance(limit, int)
+            and offset >= 1
+            and limit > 0
+        ):
+            file_path = self._resolve_memory_file(path)
+            if file_path is not None:
+                get_result = await asyncio.to_thread(
+                    _read_lines,
+                    file_path,
+                    offset,
+                    limit,
+                )
+
+        if get_result is None:
+            get_result = await super().memory_get(
+                path=path,
+                offset=offset,
+                limit=limit,
+            )
         return ToolResponse(
             content=[
                 TextBlock(
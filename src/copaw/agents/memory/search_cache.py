@@ -0,0 +1,434 @@
+# -*- coding: utf-8 -*-
+"""Caches for memory search results."""
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Hashable, Iterable
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def memory_files_fingerprint(paths: Iterable[Path]) -> tuple[str, float]:
+    """Fingerprint the memory markdown files by name, mtime and size.
+
+    Directories are scanned (non-recursively) for ``*.md`` files. Missing
+    paths are skipped, so creating or deleting a file also changes the
+    fingerprint.
+
+    Args:
+        paths: Memory files and directories to fingerprint
+
+    Returns:
+        Tuple of (digest of the (name, mtime_ns, size) entries of all files,
+        stable across processes, newest mtime in seconds)
+    """
+    entries = []
+    for path in paths:
+        try:
+            if path.is_dir():
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if entry.name.endswith(".md") and entry.is_file():
+                            stat = entry.stat()
+                            entries.append(
+                                (entry.path, stat.st_mtime_ns, stat.st_size),
+                            )
+            else:
+                stat = path.stat()
+                entries.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            continue
+    entries.sort()
+    newest_mtime = max((e[1] for e in entries), default=0) / 1e9
+    digest = hashlib.blake2b(repr(entries).encode(), digest_size=16)
+    return digest.hexdigest(), newest_mtime
+
+
+class MemorySearchCache:
+    """Bounded LRU of memory search results.
+
+    Entries are tied to a fingerprint of the memory files; when the
+    fingerprint changes (a memory file was written), the whole cache is
+    dropped. Results are not stored while a file was modified within the
+    last ``settle_seconds``, since the file watcher may not have
+    re-indexed it yet.
+    """
+
+    def __init__(self, maxsize: int = 512, settle_seconds: float = 10.0):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached results
+            settle_seconds: Time after a memory file change during which
+                results are not cached
+        """
+        self.maxsize = maxsize
+        self.settle_seconds = settle_seconds
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._fingerprint: str | None = None
+        self._newest_mtime = 0.0
+
+    def validate(self, paths: Iterable[Path]) -> bool:
+        """Drop all entries if the memory files changed.
+
+        Args:
+            paths: Memory files and directories to fingerprint
+
+        Returns:
+            True if the memory files changed since the last call
+        """
+        fingerprint, self._newest_mtime = memory_files_fingerprint(paths)
+        if fingerprint != self._fingerprint:
+            self._entries.clear()
+            self._fingerprint = fingerprint
+            return True
+        return False
+
+    @property
+    def fingerprint(self) -> str | None:
+        """Fingerprint of the memory files at the last ``validate``."""
+        return self._fingerprint
+
+    def is_settled(self) -> bool:
+        """Whether no memory file changed within ``settle_seconds``."""
+        return time.time() - self._newest_mtime >= self.settle_seconds
+
+    def get(self, key: Hashable) -> str | None:
+        """Get a cached result and mark it as recently used."""
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: Hashable, result: str) -> None:
+        """Store a result, evicting the least recently used entry."""
+        if not self.is_settled():
+            return
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self._fingerprint = None
+
+
+class SemanticQueryCache:
+    """Cache of memory search results keyed by query embedding.
+
+    A lookup hits when a cached query with the same search parameters has
+    a cosine similarity of at least ``threshold`` with the new query, so
+    paraphrased queries reuse earlier results. Embeddings are kept
+    normalized in a preallocated matrix and compared with a single
+    matrix-vector product; the least recently used slot is evicted when
+    the cache is full.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 2048,
+        threshold: float = 0.95,
+        ttl: float = 0.0,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached queries
+            threshold: Minimum cosine similarity for a hit
+            ttl: Entry lifetime in seconds, 0 for no expiry
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for SemanticQueryCache.")
+
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.ttl = ttl
+        # Allocated on first put, once the embedding dimension is known
+        self._vectors: "np.ndarray | None" = None
+        self._keys: list[Hashable | None] = [None] * maxsize
+        self._results: list[str | None] = [None] * maxsize
+        self._created = [0.0] * maxsize
+        self._last_used = [0.0] * maxsize
+        self._size = 0
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> "np.ndarray | None":
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if vector.ndim != 1 or norm == 0.0:
+            return None
+        return vector / norm
+
+    def get(self, key: Hashable, embedding: list[float]) -> str | None:
+        """Get the result of the most similar cached query.
+
+        Args:
+            key: Search parameters the result must have been produced with
+            embedding: Embedding of the query
+
+        Returns:
+            Cached search result, or None if no query is similar enough
+        """
+        if self._vectors is None or self._size == 0:
+            return None
+        vector = self._normalize(embedding)
+        if vector is None or vector.shape[0] != self._vectors.shape[1]:
+            return None
+
+        sims = self._vectors[: self._size] @ vector
+        now = time.monotonic()
+        candidates = np.flatnonzero(sims >= self.threshold)
+        # Most similar first
+        for slot in candidates[np.argsort(-sims[candidates])].tolist():
+            if self._keys[slot] != key:
+                continue
+            if self.ttl and now - self._created[slot] > self.ttl:
+                continue
+            self._last_used[slot] = now
+            return self._results[slot]
+        return None
+
+    def put(self, key: Hashable, embedding: list[float], result: str) -> None:
+        """Store the result of a query.
+
+        Args:
+            key: Search parameters the result was produced with
+            embedding: Embedding of the query
+            result: Search result to cache
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        if self._vectors is None or vector.shape[0] != self._vectors.shape[1]:
+            # First entry, or the embedding dimension changed
+            self.clear()
+            self._vectors = np.zeros(
+                (self.maxsize, vector.shape[0]),
+                dtype=np.float32,
+            )
+
+        if self._size < self.maxsize:
+            slot = self._size
+            self._size += 1
+        else:
+            slot = min(range(self.maxsize), key=self._last_used.__getitem__)
+
+        now = time.monotonic()
+        self._vectors[slot] = vector
+        self._keys[slot] = key
+        self._results[slot] = result
+        self._created[slot] = now
+        self._last_used[slot] = now
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._size = 0
+        self._keys = [None] * self.maxsize
+        self._results = [None] * self.maxsize
+
+
+class PersistentQueryCache:
+    """SQLite store of memory search results that survives restarts.
+
+    Rows are keyed by embedding model, dimensions, search parameters and
+    the SHA-256 of the query, and remember the memory files fingerprint
+    they were computed for; rows of other fingerprints are dropped by
+    ``invalidate``. Rows unused for ``ttl_days`` are pruned. Query
+    embeddings are stored along with the results so the semantic cache
+    can be warmed after a restart.
+    """
+
+    _PRUNE_EVERY = 256
+
+    def __init__(self, path: Path, ttl_days: float = 30.0):
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: Path of the SQLite database file
+            ttl_days: Days after their last use before rows are pruned
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        self.ttl_days = ttl_days
+        self._lock = threading.Lock()
+        self._puts = 0
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS query_cache ("
+                "model TEXT NOT NULL, "
+                "dims INTEGER NOT NULL, "
+                "max_results INTEGER NOT NULL, "
+                "min_score REAL NOT NULL, "
+                "query_sha256 TEXT NOT NULL, "
+                "files TEXT NOT NULL, "
+                "embedding BLOB, "
+                "result TEXT NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "last_used REAL NOT NULL, "
+                "PRIMARY KEY "
+                "(model, dims, max_results, min_score, query_sha256))",
+            )
+        self.prune()
+
+    @staticmethod
+    def _row_key(params_key: tuple, query: str) -> tuple:
+        model, dims, max_results, min_score = params_key
+        query_sha256 = hashlib.sha256(query.encode()).hexdigest()
+        return str(model), int(dims), max_results, min_score, query_sha256
+
+    def get(self, params_key: tuple, query: str, files: str) -> str | None:
+        """Get a stored result.
+
+        Args:
+            params_key: (model, dimensions, max_results, min_score)
+            query: The search query
+            files: Current memory files fingerprint
+
+        Returns:
+            The stored result, or None if missing or computed for other
+            memory files
+        """
+        row_key = self._row_key(params_key, query)
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT result FROM query_cache WHERE model = ? "
+                    "AND dims = ? AND max_results = ? AND min_score = ? "
+                    "AND query_sha256 = ? AND files = ?",
+                    (*row_key, files),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE query_cache SET last_used = ? WHERE "
+                        "model = ? AND dims = ? AND max_results = ? "
+                        "AND min_score = ? AND query_sha256 = ?",
+                        (time.time(), *row_key),
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read query cache: {e}")
+            return None
+        return row[0] if row is not None else None
+
+    def put(
+        self,
+        params_key: tuple,
+        query: str,
+        files: str,
+        result: str,
+        embedding: list[float] | None = None,
+    ) -> None:
+        """Store a result.
+
+        Args:
+            params_key: (model, dimensions, max_results, min_score)
+            query: The search query
+            files: Memory files fingerprint the result was computed for
+            result: The search result
+            embedding: Embedding of the query, if computed
+        """
+        blob = array("f", embedding).tobytes() if embedding else None
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO query_cache VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        *self._row_key(params_key, query),
+                        files,
+                        blob,
+                        result,
+                        now,
+                        now,
+                    ),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write query cache: {e}")
+            return
+
+        self._puts += 1
+        if self._puts % self._PRUNE_EVERY == 0:
+            self.prune()
+
+    def recent_embeddings(
+        self,
+        files: str,
+        limit: int,
+    ) -> list[tuple[tuple, list[float], str]]:
+        """Get the most recently used rows that have a query embedding.
+
+        Args:
+            files: Current memory files fingerprint
+            limit: Maximum number of rows
+
+        Returns:
+            List of (params_key, embedding, result), most recent first
+        """
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT model, dims, max_results, min_score, embedding, "
+                    "result FROM query_cache WHERE files = ? AND embedding "
+                    "IS NOT NULL ORDER BY last_used DESC LIMIT ?",
+                    (files, limit),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read query cache: {e}")
+            return []
+
+        entries = []
+        for model, dims, max_results, min_score, blob, result in rows:
+            embedding = array("f")
+            embedding.frombytes(blob)
+            entries.append(
+                (
+                    (model, dims, max_results, min_score),
+                    list(embedding),
+                    result,
+                ),
+            )
+        return entries
+
+    def invalidate(self, files: str) -> None:
+        """Drop rows computed for other memory files than ``files``."""
+        self._execute("DELETE FROM query_cache WHERE files != ?", (files,))
+
+    def prune(self) -> None:
+        """Drop rows unused for more than ``ttl_days``."""
+        if self.ttl_days > 0:
+            cutoff = time.time() - self.ttl_days * 86400
+            self._execute(
+                "DELETE FROM query_cache WHERE last_used < ?",
+                (cutoff,),
+            )
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(sql, params)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update query cache: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -9,6 +9,7 @@ Example:
     >>> model, formatter = create_model_and_formatter()
 """
 
+import functools
 import logging
 import os
 from typing import TYPE_CHECKING, Optional, Sequence, Tuple, Type
@@ -24,6 +25,7 @@ from ..providers import (
     get_provider_chat_model,
     load_providers_json,
 )
+from ..providers.store import get_providers_json_path
 
 if TYPE_CHECKING:
     from ..providers import ResolvedModelConfig
@@ -31,6 +33,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# ((mtime_ns, size) of providers.json, chat model class) of the last lookup
+_CHAT_MODEL_CLASS_CACHE: Optional[tuple] = None
+
 # Mapping from chat model class to formatter class
 _CHAT_MODEL_FORMATTER_MAP: dict[Type[ChatModelBase], Type[FormatterBase]] = {
     OpenAIChatModel: OpenAIChatFormatter,
@@ -54,13 +59,15 @@ def _get_formatter_for_chat_model(
     )
 
 
+@functools.lru_cache(maxsize=None)
 def _create_file_block_support_formatter(
     base_formatter_class: Type[FormatterBase],
 ) -> Type[FormatterBase]:
     """Create a formatter class with file block support.
 
     This factory function extends any Formatter class to support file blocks
-    in tool results, which are not natively supported by AgentScope.
+    in tool results, which are not natively supported by AgentScope. The
+    subclass is created once per base class and reused by all agents.
 
     Args:
         base_formatter_class: Base formatter class to extend
@@ -87,7 +94,10 @@ def _create_file_block_support_formatter(
         ) -> tuple[str, Sequence[Tuple[str, dict]]]:
             """Extend parent class to support file blocks.
 
-            Uses try-first strategy for compatibility with parent class.
+            Outputs without file blocks go straight to the parent class;
+            otherwise file and text blocks are handled here and the other
+            blocks are delegated to the parent class one by one, keeping
+            their order.
 
             Args:
                 output: Tool result output (string or list of blocks)
@@ -98,58 +108,58 @@ def _create_file_block_support_formatter(
             if isinstance(output, str):
                 return output, []
 
-            # Try parent class method first
-            try:
+            if not any(
+                isinstance(block, dict) and block.get("type") == "file"
+                for block in output
+            ):
                 return base_formatter_class.convert_tool_result_to_string(
                     output,
                 )
-            except ValueError as e:
-                if "Unsupported block type: file" not in str(e):
-                    raise
-
-                # Handle output containing file blocks
-                textual_output = []
-                multimodal_data = []
-
-                for block in output:
-                    if not isinstance(block, dict) or "type" not in block:
-                        raise ValueError(
-                            f"Invalid block: {block}, "
-                            "expected a dict with 'type' key",
-                        ) from e
-
-                    if block["type"] == "file":
-                        file_path = block.get("path", "") or block.get(
-                            "url",
-                            "",
-                        )
-                        file_name = block.get("name", file_path)
-
-                        textual_output.append(
-                            f"The returned file '{file_name}' "
-                            f"can be found at: {file_path}",
-                        )
-                        multimodal_data.append((file_path, block))
-                    else:
-                        # Delegate other block types to parent class
-                        (
-                            text,
-                            data,
-                        ) = base_formatter_class.convert_tool_result_to_string(
-                            [block],
-                        )
-                        textual_output.append(text)
-                        multimodal_data.extend(data)
-
-                if len(textual_output) == 0:
-                    return "", multimodal_data
-                elif len(textual_output) == 1:
-                    return textual_output[0], multimodal_data
+
+            # Handle output containing file blocks
+            textual_output = []
+            multimodal_data = []
+
+            for block in output:
+                if not isinstance(block, dict) or "type" not in block:
+                    raise ValueError(
+                        f"Invalid block: {block}, "
+                        "expected a dict with 'type' key",
+                    )
+
+                block_type = block["type"]
+                if block_type == "text":
+                    # Same as the parent class, without a call per block
+                    textual_output.append(block["text"])
+                elif block_type == "file":
+                    file_path = block.get("path", "") or block.get("url", "")
+                    file_name = block.get("name", file_path)
+
+                    textual_output.append(
+                        f"The returned file '{file_name}' "
+                        f"can be found at: {file_path}",
+                    )
+                    multimodal_data.append((file_path, block))
                 else:
-                    return (
-                        "\n".join("- " + _ for _ in textual_output),
-                        multimodal_data,
+                    # Delegate other block types to parent class
+                    (
+                        text,
+                        data,
+                    ) = base_formatter_class.convert_tool_result_to_string(
+                        [block],
                     )
+                    textual_output.append(text)
+                    multimodal_data.extend(data)
+
+            if len(textual_output) == 0:
+                return "", multimodal_data
+            elif len(textual_output) == 1:
+                return textual_output[0], multimodal_data
+            else:
+                return (
+                    "- " + "\n- ".join(textual_output),
+                    multimodal_data,
+                )
 
     FileBlockSupportFormatter.__name__ = (
         f"FileBlockSupport{base_formatter_class.__name__}"
@@ -225,6 +235,39 @@ def _create_model_instance(
 def _get_chat_model_class_from_provider() -> Type[ChatModelBase]:
     """Get the chat model class from provider configuration.
 
+    The result is cached until providers.json is modified.
+
+    Returns:
+        Chat model class, defaults to OpenAIChatModel if not found
+    """
+    global _CHAT_MODEL_CLASS_CACHE
+
+    try:
+        stat = get_providers_json_path().stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        signature = None
+    cached = _CHAT_MODEL_CLASS_CACHE
+    if signature is not None and cached is not None and cached[0] == signature:
+        return cached[1]
+
+    chat_model_class = _load_chat_model_class_from_provider()
+
+    # Stat again, loading providers.json may have rewritten it
+    try:
+        stat = get_providers_json_path().stat()
+        _CHAT_MODEL_CLASS_CACHE = (
+            (stat.st_mtime_ns, stat.st_size),
+            chat_model_class,
+        )
+    except OSError:
+        _CHAT_MODEL_CLASS_CACHE = None
+    return chat_model_class
+
+
+def _load_chat_model_class_from_provider() -> Type[ChatModelBase]:
+    """Resolve the chat model class by loading providers.json.
+
     Returns:
         Chat model class, defaults to OpenAIChatModel if not found
     """
@@ -299,11 +342,27 @@ def _create_formatter_instance(
     Returns:
         Formatter instance with file block support
     """
+    return _get_formatter_class_for_chat_model(chat_model_class)()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_formatter_class_for_chat_model(
+    chat_model_class: Type[ChatModelBase],
+) -> Type[FormatterBase]:
+    """Resolve the file block supporting formatter class of a chat model.
+
+    The result is cached per chat model class, so creating a formatter
+    takes a single lookup. Call ``cache_clear()`` after changing
+    _CHAT_MODEL_FORMATTER_MAP.
+
+    Args:
+        chat_model_class: The chat model class
+
+    Returns:
+        Formatter class with file block support
+    """
     base_formatter_class = _get_formatter_for_chat_model(chat_model_class)
-    formatter_class = _create_file_block_support_formatter(
-        base_formatter_class,
-    )
-    return formatter_class()
+    return _create_file_block_support_formatter(base_formatter_class)
 
 
 __all__ = [
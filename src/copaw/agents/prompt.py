@@ -5,7 +5,9 @@
 This module provides utilities for building system prompts from
 markdown configuration files in the working directory.
 """
+import io
 import logging
+import os
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -18,6 +20,13 @@ You are a helpful assistant.
 # Backward compatibility alias
 SYS_PROMPT = DEFAULT_SYS_PROMPT
 
+# Built prompt per working directory, with the (name, mtime_ns, size)
+# signature of the prompt files it was built from
+_PROMPT_CACHE: dict[str, tuple[tuple, str]] = {}
+
+# Separator between a section header and its content, and between sections
+_SECTION_SEPARATOR = "\n\n\n\n"
+
 
 class PromptConfig:
     """Configuration for system prompt building."""
@@ -33,6 +42,8 @@ class PromptConfig:
 class PromptBuilder:
     """Builder for constructing system prompts from markdown files."""
 
+    __slots__ = ("working_dir", "_paths", "prompt_buffer", "loaded_count")
+
     def __init__(self, working_dir: Path):
         """Initialize prompt builder.
 
@@ -40,32 +51,31 @@ class PromptBuilder:
             working_dir: Directory containing markdown configuration files
         """
         self.working_dir = working_dir
-        self.prompt_parts = []
+        # (path, required) per file in loading order
+        self._paths = [
+            (working_dir / filename, required)
+            for filename, required in PromptConfig.FILE_ORDER
+        ]
+        self.prompt_buffer = io.StringIO()
         self.loaded_count = 0
 
-    def _load_file(self, filename: str, required: bool) -> bool:
-        """Load a single markdown file.
+    def _read_file(
+        self,
+        file_path: Path,
+        required: bool,
+    ) -> tuple[bool, str]:
+        """Read a single markdown file.
 
         Args:
-            filename: Name of the file to load
+            file_path: Path of the file to read
             required: Whether the file is required
 
         Returns:
-            True if file was loaded successfully, False otherwise
+            Tuple of (success, content), success being False only if a
+            required file could not be read, and content being empty if
+            there is nothing to add to the prompt
         """
-        file_path = self.working_dir / filename
-
-        if not file_path.exists():
-            if required:
-                logger.warning(
-                    "%s not found in working directory (%s), using default prompt",
-                    filename,
-                    self.working_dir,
-                )
-                return False
-            else:
-                logger.debug("Optional file %s not found, skipping", filename)
-                return True  # Not an error for optional files
+        filename = file_path.name
 
         try:
             content = file_path.read_text(encoding="utf-8").strip()
@@ -76,19 +86,19 @@ class PromptBuilder:
                 if len(parts) >= 3:
                     content = parts[2].strip()
 
-            if content:
-                if self.prompt_parts:  # Add separator if not first section
-                    self.prompt_parts.append("")
-                # Add section header with filename
-                self.prompt_parts.append(f"# {filename}")
-                self.prompt_parts.append("")
-                self.prompt_parts.append(content)
-                self.loaded_count += 1
-                logger.debug("Loaded %s", filename)
-            else:
-                logger.debug("Skipped empty file: %s", filename)
+            return True, content
 
-            return True
+        except FileNotFoundError:
+            if required:
+                logger.warning(
+                    "%s not found in working directory (%s), using default prompt",
+                    filename,
+                    self.working_dir,
+                )
+                return False, ""
+            else:
+                logger.debug("Optional file %s not found, skipping", filename)
+                return True, ""  # Not an error for optional files
 
         except Exception as e:
             if required:
@@ -98,32 +108,113 @@ class PromptBuilder:
                     e,
                     exc_info=True,
                 )
-                return False
+                return False, ""
             else:
                 logger.warning(
                     "Failed to read optional file %s: %s",
                     filename,
                     e,
                 )
-                return True  # Not fatal for optional files
+                return True, ""  # Not fatal for optional files
+
+    def _add_section(self, filename: str, content: str) -> None:
+        """Append the content of a file as a prompt section.
+
+        Args:
+            filename: Name of the file, used as section header
+            content: Content of the file
+        """
+        if not content:
+            logger.debug("Skipped empty file: %s", filename)
+            return
+
+        buf = self.prompt_buffer
+        if self.loaded_count:  # Add separator if not first section
+            buf.write(_SECTION_SEPARATOR)
+        # Add section header with filename
+        buf.write("# ")
+        buf.write(filename)
+        buf.write(_SECTION_SEPARATOR)
+        buf.write(content)
+        self.loaded_count += 1
+        logger.debug("Loaded %s", filename)
+
+    def _load_file(self, file_path: Path, required: bool) -> bool:
+        """Load a single markdown file.
+
+        Args:
+            file_path: Path of the file to load
+            required: Whether the file is required
+
+        Returns:
+            True if file was loaded successfully, False otherwise
+        """
+        ok, content = self._read_file(file_path, required)
+        if ok:
+            self._add_section(file_path.name, content)
+        return ok
+
+    def files_signature(self) -> tuple:
+        """Stat the prompt files.
+
+        Returns:
+            Tuple of (filename, mtime_ns, size) per file, with None for
+            mtime_ns and size if the file is missing
+        """
+        signature = []
+        for file_path, _ in self._paths:
+            try:
+                stat = os.stat(file_path)
+                signature.append(
+                    (file_path.name, stat.st_mtime_ns, stat.st_size),
+                )
+            except OSError:
+                signature.append((file_path.name, None, None))
+        return tuple(signature)
 
     def build(self) -> str:
         """Build the system prompt from markdown files.
 
+        The result is cached per working directory and reused until one of
+        the files is created, deleted or modified.
+
+        Returns:
+            Constructed system prompt string
+        """
+        cache_key = str(self.working_dir)
+        signature = self.files_signature()
+        cached = _PROMPT_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        final_prompt = self._build()
+        _PROMPT_CACHE[cache_key] = (signature, final_prompt)
+        return final_prompt
+
+    def _build(self) -> str:
+        """Build the system prompt by reading the markdown files.
+
         Returns:
             Constructed system prompt string
         """
-        for filename, required in PromptConfig.FILE_ORDER:
-            if not self._load_file(filename, required):
+        for file_path, required in self._paths:
+            if not self._load_file(file_path, required):
                 # Required file failed to load
                 return DEFAULT_SYS_PROMPT
 
-        if not self.prompt_parts:
+        return self._finish()
+
+    def _finish(self) -> str:
+        """Get the system prompt from the loaded sections.
+
+        Returns:
+            Constructed system prompt string
+        """
+        if not self.loaded_count:
             logger.warning("No content loaded from working directory")
             return DEFAULT_SYS_PROMPT
 
-        # Join all parts with double newlines
-        final_prompt = "\n\n".join(self.prompt_parts)
+        final_prompt = self.prompt_buffer.getvalue()
 
         logger.debug(
             "System prompt built from %d file(s), total length: %d chars",
@@ -161,19 +252,23 @@ def build_system_prompt_from_working_dir() -> str:
     return builder.build()
 
 
-def build_bootstrap_guidance(
-    language: str = "zh",
-) -> str:
-    """Build bootstrap guidance message for first-time setup.
+def get_prompt_files_signature() -> tuple:
+    """Get the signature of the prompt files in the working directory.
 
-    Args:
-        language: Language code (en/zh)
+    The signature changes whenever a prompt file is created, deleted or
+    modified, i.e. whenever build_system_prompt_from_working_dir may
+    return a different prompt.
 
     Returns:
-        Formatted bootstrap guidance message
+        Tuple of (filename, mtime_ns, size) per prompt file
     """
-    if language == "en":
-        return """# 🌟 BOOTSTRAP MODE ACTIVATED
+    from ..constant import WORKING_DIR
+
+    return PromptBuilder(working_dir=Path(WORKING_DIR)).files_signature()
+
+
+# Bootstrap guidance messages, prepended to the first user message
+_BOOTSTRAP_GUIDANCE_EN = """# 🌟 BOOTSTRAP MODE ACTIVATED
 
 **IMPORTANT: You are in first-time setup mode.**
 
@@ -190,8 +285,8 @@ If the user explicitly says they want to skip the bootstrap or just want their q
 
 **Original user message:**
 """
-    else:  # zh
-        return """# 🌟 引导模式已激活
+
+_BOOTSTRAP_GUIDANCE_ZH = """# 🌟 引导模式已激活
 
 **重要：你正处于首次设置模式。**
 
@@ -210,9 +305,26 @@ If the user explicitly says they want to skip the bootstrap or just want their q
 """
 
 
+def build_bootstrap_guidance(
+    language: str = "zh",
+) -> str:
+    """Build bootstrap guidance message for first-time setup.
+
+    Args:
+        language: Language code (en/zh)
+
+    Returns:
+        Formatted bootstrap guidance message
+    """
+    if language == "en":
+        return _BOOTSTRAP_GUIDANCE_EN
+    return _BOOTSTRAP_GUIDANCE_ZH
+
+
 __all__ = [
     "build_system_prompt_from_working_dir",
     "build_bootstrap_guidance",
+    "get_prompt_files_signature",
     "PromptBuilder",
     "PromptConfig",
     "DEFAULT_SYS_PROMPT",
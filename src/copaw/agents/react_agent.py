@@ -4,6 +4,8 @@
 This module provides the main CoPawAgent class built on ReActAgent,
 with integrated tools, skills, and memory management.
 """
+import copy
+import functools
 import logging
 import os
 from typing import Any, List, Optional, Type
@@ -11,17 +13,20 @@ from typing import Any, List, Optional, Type
 from agentscope.agent import ReActAgent
 from agentscope.message import Msg
 from agentscope.tool import Toolkit
+from agentscope.tool._types import AgentSkill, RegisteredToolFunction
 from pydantic import BaseModel
 
 from .command_handler import CommandHandler
 from .hooks import BootstrapHook, MemoryCompactionHook
 from .memory import CoPawInMemoryMemory
 from .model_factory import create_model_and_formatter
-from .prompt import build_system_prompt_from_working_dir
+from .prompt import (
+    build_system_prompt_from_working_dir,
+    get_prompt_files_signature,
+)
 from .skills_manager import (
     ensure_skills_initialized,
-    get_working_skills_dir,
-    list_available_skills,
+    list_available_skills_metadata,
 )
 from .tools import (
     browser_use,
@@ -34,17 +39,122 @@ from .tools import (
     send_file_to_user,
     write_file,
 )
-from .utils import process_file_and_media_blocks_in_message
+from .utils import (
+    _get_token_counter,
+    has_file_or_media_blocks,
+    process_file_and_media_blocks_in_message,
+)
 from ..agents.memory import MemoryManager
-from ..config import load_config
+from ..config import get_config_path, load_config
 from ..constant import (
     MEMORY_COMPACT_KEEP_RECENT,
     MEMORY_COMPACT_RATIO,
+    WARMUP_ENABLED,
     WORKING_DIR,
 )
 
 logger = logging.getLogger(__name__)
 
+# Built-in tools registered to every agent, in registration order
+_BUILTIN_TOOL_FUNCTIONS = (
+    execute_shell_command,
+    read_file,
+    write_file,
+    edit_file,
+    browser_use,
+    desktop_screenshot,
+    send_file_to_user,
+    get_current_time,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_builtin_tools() -> dict[str, RegisteredToolFunction]:
+    """Register the built-in tools once and return them by name.
+
+    Parsing the docstrings and signatures into JSON schemas is only done
+    on the first call.
+
+    Returns:
+        Dict mapping tool name to registered tool function
+    """
+    toolkit = Toolkit()
+    for tool_func in _BUILTIN_TOOL_FUNCTIONS:
+        toolkit.register_tool_function(tool_func)
+    return toolkit.tools
+
+
+# ((mtime_ns, size) of config.json, agent language) from the last load
+_AGENT_LANGUAGE_CACHE: Optional[tuple[Optional[tuple], str]] = None
+
+
+def _get_agent_language() -> str:
+    """Get the agent language from the config.
+
+    config.json is only loaded again when it changed since the last call.
+
+    Returns:
+        Language code (en/zh)
+    """
+    global _AGENT_LANGUAGE_CACHE
+
+    try:
+        stat = get_config_path().stat()
+        signature: Optional[tuple] = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        signature = None
+    cached = _AGENT_LANGUAGE_CACHE
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    language = load_config().agents.language
+    _AGENT_LANGUAGE_CACHE = (signature, language)
+    return language
+
+
+# (skills metadata, agent skills) the agent skills were last built from
+_AGENT_SKILLS_CACHE: Optional[tuple[list, dict[str, AgentSkill]]] = None
+
+
+def _get_agent_skills() -> dict[str, AgentSkill]:
+    """Get the agent skills from the active skills directory by name.
+
+    The skills are only rebuilt when the set of skills or one of their
+    SKILL.md files changed, otherwise the previous result is returned.
+
+    Returns:
+        Dict mapping skill name to agent skill
+    """
+    global _AGENT_SKILLS_CACHE
+
+    metadata = list_available_skills_metadata()
+    if _AGENT_SKILLS_CACHE is not None and _AGENT_SKILLS_CACHE[0] == metadata:
+        return _AGENT_SKILLS_CACHE[1]
+
+    # Check skills initialization
+    ensure_skills_initialized()
+
+    # Only name and description go into the prompt; the agent reads
+    # the full SKILL.md when it uses a skill.
+    skills: dict[str, AgentSkill] = {}
+    for name, description, skill_dir in metadata:
+        if name in skills:
+            logger.error(
+                "Failed to register skill '%s': an agent skill with "
+                "this name is already registered",
+                skill_dir.name,
+            )
+            continue
+        skills[name] = AgentSkill(
+            name=name,
+            description=description,
+            dir=str(skill_dir),
+        )
+        logger.debug("Registered skill: %s", skill_dir.name)
+
+    _AGENT_SKILLS_CACHE = (metadata, skills)
+    return skills
+
 
 class CoPawAgent(ReActAgent):
     """CoPaw Agent with integrated tools, skills, and memory management.
@@ -138,15 +248,12 @@ class CoPawAgent(ReActAgent):
         """
         toolkit = Toolkit()
 
-        # Register built-in tools
-        toolkit.register_tool_function(execute_shell_command)
-        toolkit.register_tool_function(read_file)
-        toolkit.register_tool_function(write_file)
-        toolkit.register_tool_function(edit_file)
-        toolkit.register_tool_function(browser_use)
-        toolkit.register_tool_function(desktop_screenshot)
-        toolkit.register_tool_function(send_file_to_user)
-        toolkit.register_tool_function(get_current_time)
+        # Register built-in tools. Each agent gets its own copy of the
+        # registered functions since the toolkit may update them in place.
+        toolkit.tools.update(
+            (name, copy.copy(tool))
+            for name, tool in _get_builtin_tools().items()
+        )
 
         return toolkit
 
@@ -156,24 +263,9 @@ class CoPawAgent(ReActAgent):
         Args:
             toolkit: Toolkit to register skills to
         """
-        # Check skills initialization
-        ensure_skills_initialized()
-
-        working_skills_dir = get_working_skills_dir()
-        available_skills = list_available_skills()
-
-        for skill_name in available_skills:
-            skill_dir = working_skills_dir / skill_name
-            if skill_dir.exists():
-                try:
-                    toolkit.register_agent_skill(str(skill_dir))
-                    logger.debug("Registered skill: %s", skill_name)
-                except Exception as e:
-                    logger.error(
-                        "Failed to register skill '%s': %s",
-                        skill_name,
-                        e,
-                    )
+        # Skills are shared by all agents and only rebuilt when a skill
+        # changed on disk
+        toolkit.skills.update(_get_agent_skills())
 
     def _build_sys_prompt(self) -> str:
         """Build system prompt from working dir files and env context.
@@ -181,6 +273,7 @@ class CoPawAgent(ReActAgent):
         Returns:
             Complete system prompt string
         """
+        self._sys_prompt_signature = get_prompt_files_signature()
         sys_prompt = build_system_prompt_from_working_dir()
         if self._env_context is not None:
             sys_prompt = self._env_context + "\n\n" + sys_prompt
@@ -217,10 +310,9 @@ class CoPawAgent(ReActAgent):
     def _register_hooks(self) -> None:
         """Register pre-reasoning hooks for bootstrap and memory compaction."""
         # Bootstrap hook - checks BOOTSTRAP.md on first interaction
-        config = load_config()
         bootstrap_hook = BootstrapHook(
             working_dir=WORKING_DIR,
-            language=config.agents.language,
+            language=_get_agent_language(),
         )
         self.register_instance_hook(
             hook_type="pre_reasoning",
@@ -243,21 +335,34 @@ class CoPawAgent(ReActAgent):
             )
             logger.debug("Registered memory compaction hook")
 
+    def load_state_dict(self, state_dict: dict, strict: bool = True) -> None:
+        """Load the agent state, e.g. from a saved session.
+
+        The restored system prompt was built from the prompt files as they
+        were when the session was saved, so forget the signature of the
+        current prompt and let the next rebuild_sys_prompt rebuild it.
+        """
+        super().load_state_dict(state_dict, strict=strict)
+        self._sys_prompt_signature = None
+
     def rebuild_sys_prompt(self) -> None:
         """Rebuild and replace the system prompt.
 
         Useful after load_session_state to ensure the prompt reflects
         the latest AGENTS.md / SOUL.md / PROFILE.md on disk.
 
-        Updates both self._sys_prompt and the first system-role
-        message stored in self.memory.content (if one exists).
+        Updates both self._sys_prompt and the first message stored in
+        self.memory.content if it is a system message. The prompt is only
+        rebuilt if a prompt file changed since it was last built, or if it
+        was restored by load_state_dict.
         """
-        self._sys_prompt = self._build_sys_prompt()
+        if get_prompt_files_signature() != self._sys_prompt_signature:
+            self._sys_prompt = self._build_sys_prompt()
 
-        for msg, _marks in self.memory.content:
-            if msg.role == "system":
+        if self.memory.content:
+            msg, _marks = self.memory.content[0]
+            if msg.role == "system" and msg.content is not self.sys_prompt:
                 msg.content = self.sys_prompt
-            break
 
     async def register_mcp_clients(self) -> None:
         """Register MCP clients on this agent's toolkit after construction."""
@@ -279,7 +384,7 @@ class CoPawAgent(ReActAgent):
             Response message
         """
         # Process file and media blocks in messages
-        if msg is not None:
+        if msg is not None and has_file_or_media_blocks(msg):
             await process_file_and_media_blocks_in_message(msg)
 
         # Check if message is a system command
@@ -296,3 +401,22 @@ class CoPawAgent(ReActAgent):
 
         # Normal message processing
         return await super().reply(msg=msg, structured_model=structured_model)
+
+
+def _warmup() -> None:
+    """Load the slow, lazily initialized resources ahead of time.
+
+    Loads the tokenizer used for memory compaction and fills the system
+    prompt and skill metadata caches, which otherwise happens on the
+    first user message.
+    """
+    try:
+        _get_token_counter()
+        build_system_prompt_from_working_dir()
+        list_available_skills_metadata()
+    except Exception as e:
+        logger.warning(f"Agent warmup failed: {e}")
+
+
+if WARMUP_ENABLED:
+    _warmup()
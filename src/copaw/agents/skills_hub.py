@@ -2,26 +2,105 @@
 """Skills hub client and install helpers."""
 from __future__ import annotations
 
+import io
 import json
 import logging
 import os
+import random
 import re
+import threading
 import time
-import base64
+import binascii
+import contextvars
+import functools
+import hashlib
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
-from urllib.parse import urlencode, urlparse, unquote
+from pathlib import Path
+from typing import Any, Callable, Iterable, TypeVar
+from urllib.parse import ParseResult, quote, urlencode, urlparse, unquote
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
 import frontmatter
 
 from .skills_manager import SkillService
+from ..constant import WORKING_DIR
+from ..envs import get_environ_version
 
-logger = logging.getLogger(__name__)
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
 
+    _REQUESTS_AVAILABLE = True
+except ImportError:
+    _REQUESTS_AVAILABLE = False
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Shared keep-alive session, so repeated requests to the same hub or
+# GitHub host reuse their connection instead of a new TCP+TLS handshake
+_HTTP_SESSION: "requests.Session | None" = None
+_HTTP_SESSION_LOCK = threading.Lock()
+_HTTP_CONNECT_TIMEOUT = 5.0
+
+# GitHub API responses are kept one file per URL in the working dir, so
+# repeated imports can revalidate them with If-None-Match. The index maps
+# the file key to its size in bytes, least recently used first.
+_GITHUB_ETAG_INDEX: "OrderedDict[str, int] | None" = None
+_GITHUB_ETAG_CACHE_SIZE = 256
+_GITHUB_ETAG_MAX_BODY = 1 << 20
+_GITHUB_ETAG_MAX_BYTES = 32 << 20
+_GITHUB_ETAG_LOCK = threading.Lock()
+
+# (owner, repo, ref) -> (monotonic time, response) of recursive git tree
+# listings, shared by skill root discovery and bundle file collection
+_GITHUB_TREE_CACHE: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+_GITHUB_TREE_CACHE_SIZE = 64
+_GITHUB_TREE_TTL = 300.0
+_GITHUB_TREE_LOCK = threading.Lock()
+
+# Request URL -> (fetched at, JSON) of hub search and detail responses,
+# so re-listing or retrying an install does not hit the hub again
+_HUB_JSON_CACHE: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+_HUB_JSON_CACHE_SIZE = 256
+_HUB_JSON_TTL = 60.0
+_HUB_JSON_LOCK = threading.Lock()
+
+# Installs in progress, so concurrent requests for the same skill share
+# one download and one create_skill call
+_INSTALLS_IN_FLIGHT: dict[tuple, Future] = {}
+_INSTALLS_IN_FLIGHT_LOCK = threading.Lock()
+# Serializes writing and enabling imported skills, so installs from
+# different URLs that resolve to the same skill name cannot replace the
+# same directory at once
+_SKILL_WRITE_LOCK = threading.Lock()
+
+# Host -> (consecutive failed requests, time of the last failure). Hosts
+# that keep failing are skipped for a while instead of waiting out every
+# timeout and retry again
+_HOST_FAILURES: dict[str, tuple[int, float]] = {}
+_HOST_FAILURES_LOCK = threading.Lock()
+_HOST_FAILURE_THRESHOLD = 3
+_HOST_COOL_OFF = 30.0
+
+
+class HubHostUnavailableError(RuntimeError):
+    """Raised without a request while a host is marked as failing."""
+
+
+@dataclass(frozen=True, slots=True)
 class HubSkillResult:
     slug: str
     name: str
@@ -30,13 +109,20 @@ class HubSkillResult:
     source_url: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HubInstallResult:
     name: str
     enabled: bool
     source_url: str
 
 
+_FALLBACK_NAME_RE = re.compile(r"[^a-zA-Z0-9_-]")
+_SKILL_KEY_RE = re.compile(r"[^a-z0-9]+")
+
+# Path components that must not appear in bundle file trees
+_UNSAFE_TREE_KEYS = frozenset({".", ".."})
+
+
 RETRYABLE_HTTP_STATUS = {
     408,
     409,
@@ -49,6 +135,27 @@ RETRYABLE_HTTP_STATUS = {
 }
 
 
+def _cached_per_environ(func: Callable[[], _R]) -> Callable[[], _R]:
+    """Cache a setting read from env vars until they change.
+
+    The cache is keyed on copaw.envs' environ version, so settings changed
+    through copaw.envs are picked up on the next call.
+    """
+
+    @functools.lru_cache(maxsize=1)
+    def _load(environ_version: int) -> _R:
+        del environ_version
+        return func()
+
+    @functools.wraps(func)
+    def wrapper() -> _R:
+        return _load(get_environ_version())
+
+    wrapper.cache_clear = _load.cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+@_cached_per_environ
 def _hub_http_timeout() -> float:
     raw = os.environ.get("COPAW_SKILLS_HUB_HTTP_TIMEOUT", "15")
     try:
@@ -57,6 +164,7 @@ def _hub_http_timeout() -> float:
         return 15.0
 
 
+@_cached_per_environ
 def _hub_http_retries() -> int:
     raw = os.environ.get("COPAW_SKILLS_HUB_HTTP_RETRIES", "3")
     try:
@@ -65,6 +173,7 @@ def _hub_http_retries() -> int:
         return 3
 
 
+@_cached_per_environ
 def _hub_http_backoff_base() -> float:
     raw = os.environ.get("COPAW_SKILLS_HUB_HTTP_BACKOFF_BASE", "0.8")
     try:
@@ -73,6 +182,7 @@ def _hub_http_backoff_base() -> float:
         return 0.8
 
 
+@_cached_per_environ
 def _hub_http_backoff_cap() -> float:
     raw = os.environ.get("COPAW_SKILLS_HUB_HTTP_BACKOFF_CAP", "6")
     try:
@@ -81,16 +191,55 @@ def _hub_http_backoff_cap() -> float:
         return 6.0
 
 
+@_cached_per_environ
+def _hub_http_concurrency() -> int:
+    raw = os.environ.get("COPAW_SKILLS_HUB_HTTP_CONCURRENCY", "8")
+    try:
+        return max(1, int(raw))
+    except Exception:
+        return 8
+
+
+def _map_concurrently(
+    func: Callable[[_T], _R],
+    items: Iterable[_T],
+) -> list[_R]:
+    """Call func on every item in worker threads, keeping the item order.
+
+    At most COPAW_SKILLS_HUB_HTTP_CONCURRENCY calls run at once. The first
+    exception, in item order, is raised after all calls are submitted.
+    """
+    items = list(items)
+    workers = min(_hub_http_concurrency(), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix="skills-hub",
+    ) as executor:
+        # Run each call in a copy of the caller's context so context
+        # variables such as the per-import download cache carry over
+        futures = [
+            executor.submit(contextvars.copy_context().run, func, item)
+            for item in items
+        ]
+        return [future.result() for future in futures]
+
+
 def _compute_backoff_seconds(attempt: int) -> float:
     base = _hub_http_backoff_base()
     cap = _hub_http_backoff_cap()
-    return min(cap, base * (2 ** max(0, attempt - 1)))
+    # Full jitter, so concurrent clients hitting the same 429/503 do not
+    # all retry at the same instants
+    return random.uniform(0, min(cap, base * (2 ** max(0, attempt - 1))))
 
 
+@_cached_per_environ
 def _hub_base_url() -> str:
     return os.environ.get("COPAW_SKILLS_HUB_BASE_URL", "https://clawhub.ai")
 
 
+@_cached_per_environ
 def _hub_search_path() -> str:
     return os.environ.get(
         "COPAW_SKILLS_HUB_SEARCH_PATH",
@@ -98,6 +247,7 @@ def _hub_search_path() -> str:
     )
 
 
+@_cached_per_environ
 def _hub_version_path() -> str:
     return os.environ.get(
         "COPAW_SKILLS_HUB_VERSION_PATH",
@@ -105,6 +255,7 @@ def _hub_version_path() -> str:
     )
 
 
+@_cached_per_environ
 def _hub_detail_path() -> str:
     return os.environ.get(
         "COPAW_SKILLS_HUB_DETAIL_PATH",
@@ -112,6 +263,7 @@ def _hub_detail_path() -> str:
     )
 
 
+@_cached_per_environ
 def _hub_file_path() -> str:
     return os.environ.get(
         "COPAW_SKILLS_HUB_FILE_PATH",
@@ -119,43 +271,287 @@ def _hub_file_path() -> str:
     )
 
 
+def _reset_hub_config_cache() -> None:
+    """Re-read all skills hub settings from env vars on the next call."""
+    for setting in (
+        _hub_http_timeout,
+        _hub_http_retries,
+        _hub_http_backoff_base,
+        _hub_http_backoff_cap,
+        _hub_http_concurrency,
+        _hub_base_url,
+        _hub_search_path,
+        _hub_version_path,
+        _hub_detail_path,
+        _hub_file_path,
+        _hub_bundle_path,
+    ):
+        setting.cache_clear()  # type: ignore[attr-defined]
+
+
+@_cached_per_environ
+def _hub_bundle_path() -> str:
+    # Optional endpoint returning all files of a skill version at once,
+    # e.g. "/api/v1/skills/{slug}/bundle"; disabled when empty
+    return os.environ.get("COPAW_SKILLS_HUB_BUNDLE_PATH", "")
+
+
 def _join_url(base: str, path: str) -> str:
     return f"{base.rstrip('/')}/{path.lstrip('/')}"
 
 
+def _get_http_session() -> "requests.Session":
+    global _HTTP_SESSION
+    with _HTTP_SESSION_LOCK:
+        if _HTTP_SESSION is None:
+            session = requests.Session()
+            # Retries are handled by _http_get with its own backoff
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=32,
+                max_retries=0,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _HTTP_SESSION = session
+        return _HTTP_SESSION
+
+
+def _open_url(
+    full_url: str,
+    headers: dict[str, str],
+    timeout: float,
+) -> tuple[int, bytes, str | None]:
+    """GET a URL, raising urllib's exception types.
+
+    Uses the shared keep-alive session if requests is installed, so callers
+    can keep handling HTTPError / URLError / TimeoutError either way.
+
+    Returns:
+        Tuple of (status, body, ETag header); the body is empty for a
+        304 Not Modified response
+    """
+    if not _REQUESTS_AVAILABLE:
+        req = Request(full_url, headers=headers)
+        try:
+            with urlopen(req, timeout=timeout) as resp:
+                return (
+                    resp.status,
+                    resp.read(),
+                    resp.headers.get("ETag"),
+                )
+        except HTTPError as e:
+            if e.code == 304:
+                return 304, b"", None
+            raise
+
+    try:
+        resp = _get_http_session().get(
+            full_url,
+            headers=headers,
+            # Fail fast on unreachable hosts, _http_get retries them
+            timeout=(min(_HTTP_CONNECT_TIMEOUT, timeout), timeout),
+        )
+    except requests.Timeout as e:
+        raise TimeoutError(str(e)) from e
+    except requests.RequestException as e:
+        raise URLError(e) from e
+    if resp.status_code >= 400:
+        raise HTTPError(
+            full_url,
+            resp.status_code,
+            resp.reason,
+            resp.headers,
+            io.BytesIO(resp.content),
+        )
+    if resp.status_code == 304:
+        return 304, b"", None
+    return (
+        resp.status_code,
+        resp.content,
+        resp.headers.get("ETag"),
+    )
+
+
+def _github_etag_cache_dir() -> Path:
+    return WORKING_DIR / ".skills_hub_etags"
+
+
+def _github_etag_key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def _get_github_etag_index() -> OrderedDict[str, int]:
+    """Load the GitHub response cache index; call with the lock held."""
+    global _GITHUB_ETAG_INDEX
+    if _GITHUB_ETAG_INDEX is None:
+        files: list[tuple[float, str, int]] = []
+        try:
+            with os.scandir(_github_etag_cache_dir()) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    stat = entry.stat()
+                    files.append(
+                        (
+                            stat.st_mtime,
+                            entry.name[: -len(".json")],
+                            stat.st_size,
+                        ),
+                    )
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug("Ignoring unreadable GitHub ETag cache: %s", e)
+        files.sort()
+        _GITHUB_ETAG_INDEX = OrderedDict((key, size) for _, key, size in files)
+    return _GITHUB_ETAG_INDEX
+
+
+def _github_cached_response(url: str) -> tuple[str, str] | None:
+    key = _github_etag_key(url)
+    with _GITHUB_ETAG_LOCK:
+        index = _get_github_etag_index()
+        if key not in index:
+            return None
+        index.move_to_end(key)
+    try:
+        with open(
+            _github_etag_cache_dir() / f"{key}.json",
+            "rb",
+        ) as f:
+            entry = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("url") != url:
+        return None
+    return str(entry.get("etag") or ""), str(entry.get("body") or "")
+
+
+def _store_github_response(url: str, etag: str, raw_body: bytes) -> None:
+    if len(raw_body) > _GITHUB_ETAG_MAX_BODY:
+        return
+    key = _github_etag_key(url)
+    payload = json.dumps(
+        {"url": url, "etag": etag, "body": raw_body.decode("utf-8")},
+        ensure_ascii=False,
+    ).encode("utf-8")
+    cache_dir = _github_etag_cache_dir()
+    path = cache_dir / f"{key}.json"
+    # Only this URL's file is written, outside the lock; the temp name is
+    # per thread so concurrent fetches of one URL do not clash
+    tmp_path = cache_dir / f"{key}.{threading.get_ident()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug("Failed to save GitHub ETag cache entry: %s", e)
+        return
+
+    evicted: list[str] = []
+    with _GITHUB_ETAG_LOCK:
+        index = _get_github_etag_index()
+        index[key] = len(payload)
+        index.move_to_end(key)
+        total = sum(index.values())
+        while len(index) > 1 and (
+            len(index) > _GITHUB_ETAG_CACHE_SIZE
+            or total > _GITHUB_ETAG_MAX_BYTES
+        ):
+            old_key, old_size = index.popitem(last=False)
+            total -= old_size
+            evicted.append(old_key)
+    for old_key in evicted:
+        try:
+            (cache_dir / f"{old_key}.json").unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug("Failed to evict GitHub ETag cache entry: %s", e)
+
+
+def _with_host_circuit_breaker(
+    func: Callable[..., bytes],
+) -> Callable[..., bytes]:
+    """Fail fast on hosts whose recent requests kept failing.
+
+    After _HOST_FAILURE_THRESHOLD requests in a row end in a connection
+    error, timeout or 5xx (each after its own retries), calls for that
+    host raise HubHostUnavailableError for _HOST_COOL_OFF seconds. The
+    next call after that goes through; a success resets the count.
+    """
+
+    @functools.wraps(func)
+    def wrapper(url: str, *args: Any, **kwargs: Any) -> bytes:
+        host = (urlparse(url).hostname or "").lower()
+        with _HOST_FAILURES_LOCK:
+            failures, failed_at = _HOST_FAILURES.get(host, (0, 0.0))
+        remaining = failed_at + _HOST_COOL_OFF - time.monotonic()
+        if failures >= _HOST_FAILURE_THRESHOLD and remaining > 0:
+            raise HubHostUnavailableError(
+                f"{host} failed {failures} requests in a row, "
+                f"not retrying for another {remaining:.0f}s",
+            )
+        try:
+            body = func(url, *args, **kwargs)
+        except (URLError, TimeoutError) as e:
+            # Client errors such as 404 mean the host itself is fine
+            if isinstance(e, HTTPError) and e.code < 500:
+                with _HOST_FAILURES_LOCK:
+                    _HOST_FAILURES.pop(host, None)
+            else:
+                with _HOST_FAILURES_LOCK:
+                    failures = _HOST_FAILURES.get(host, (0, 0.0))[0]
+                    _HOST_FAILURES[host] = (failures + 1, time.monotonic())
+            raise
+        with _HOST_FAILURES_LOCK:
+            _HOST_FAILURES.pop(host, None)
+        return body
+
+    return wrapper
+
+
+@_with_host_circuit_breaker
 # pylint: disable-next=too-many-branches,too-many-statements
 def _http_get(
     url: str,
     params: dict[str, Any] | None = None,
     accept: str = "application/json",
-) -> str:
+) -> bytes:
     full_url = url
     if params:
         full_url = f"{url}?{urlencode(params)}"
-    req = Request(
-        full_url,
-        headers={
-            "Accept": accept,
-            "User-Agent": "copaw-skills-hub/1.0",
-        },
-    )
-    parsed = urlparse(full_url)
-    host = (parsed.netloc or "").lower()
+    headers = {
+        "Accept": accept,
+        "User-Agent": "copaw-skills-hub/1.0",
+    }
+    # Parse once; the headers below are reused across retries
+    host = (urlparse(full_url).netloc or "").lower()
+    is_github_api = "api.github.com" in host
     github_token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
-    if github_token and "api.github.com" in host:
-        req.add_header("Authorization", f"Bearer {github_token}")
+    if github_token and is_github_api:
+        headers["Authorization"] = f"Bearer {github_token}"
+    # Revalidate cached GitHub API responses; a 304 does not count
+    # against the rate limit
+    cached = _github_cached_response(full_url) if is_github_api else None
+    if cached is not None:
+        headers["If-None-Match"] = cached[0]
     retries = _hub_http_retries()
     timeout = _hub_http_timeout()
     attempts = retries + 1
     last_error: Exception | None = None
     for attempt in range(1, attempts + 1):
         try:
-            with urlopen(req, timeout=timeout) as resp:
-                return resp.read().decode("utf-8")
+            status, body, etag = _open_url(full_url, headers, timeout)
+            if status == 304 and cached is not None:
+                return cached[1].encode("utf-8")
+            if is_github_api and etag:
+                _store_github_response(full_url, etag, body)
+            return body
         except HTTPError as e:
             last_error = e
             status = getattr(e, "code", 0) or 0
-            if status == 403 and "api.github.com" in host:
+            if status == 403 and is_github_api:
                 body = ""
                 try:
                     body = e.read().decode("utf-8", errors="ignore")
@@ -221,15 +617,42 @@ def _http_get(
 
 def _http_json_get(url: str, params: dict[str, Any] | None = None) -> Any:
     body = _http_get(url, params=params, accept="application/json")
+    # Parse the raw bytes, without decoding them to str first
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(body)
     return json.loads(body)
 
 
+def _cached_json_get(url: str, params: dict[str, Any] | None = None) -> Any:
+    """
+    GET a hub JSON endpoint, reusing responses for a minute.
+
+    The result is shared between callers and must not be modified.
+    """
+    key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+    now = time.monotonic()
+    with _HUB_JSON_LOCK:
+        cached = _HUB_JSON_CACHE.get(key)
+        if cached is not None and now - cached[0] < _HUB_JSON_TTL:
+            _HUB_JSON_CACHE.move_to_end(key)
+            return cached[1]
+
+    data = _http_json_get(url, params=params)
+
+    with _HUB_JSON_LOCK:
+        _HUB_JSON_CACHE[key] = (now, data)
+        _HUB_JSON_CACHE.move_to_end(key)
+        while len(_HUB_JSON_CACHE) > _HUB_JSON_CACHE_SIZE:
+            _HUB_JSON_CACHE.popitem(last=False)
+    return data
+
+
 def _http_text_get(url: str, params: dict[str, Any] | None = None) -> str:
     return _http_get(
         url,
         params=params,
         accept="text/plain, text/markdown, */*",
-    )
+    ).decode("utf-8")
 
 
 def _norm_search_items(data: Any) -> list[dict[str, Any]]:
@@ -294,32 +717,39 @@ def _sanitize_tree(tree: Any) -> dict[str, Any]:
     if not isinstance(tree, dict):
         return {}
     out: dict[str, Any] = {}
-    for key, value in tree.items():
-        if not isinstance(key, str):
-            continue
-        if key in (".", "..") or "/" in key or "\\" in key:
-            continue
-        if isinstance(value, dict):
-            out[key] = _sanitize_tree(value)
-        elif isinstance(value, str):
-            out[key] = value
+    # Walk iteratively, so deeply nested bundles cannot hit the recursion
+    # limit
+    stack: list[tuple[dict, dict[str, Any]]] = [(tree, out)]
+    while stack:
+        src, dst = stack.pop()
+        for key, value in src.items():
+            if not isinstance(key, str):
+                continue
+            if key in _UNSAFE_TREE_KEYS or "/" in key or "\\" in key:
+                continue
+            if isinstance(value, dict):
+                child: dict[str, Any] = {}
+                dst[key] = child
+                stack.append((value, child))
+            elif isinstance(value, str):
+                dst[key] = value
     return out
 
 
 def _bundle_has_content(payload: Any) -> bool:
     if not isinstance(payload, dict):
         return False
+    # Hydrated hub payloads carry a files mapping, check that first
+    files = payload.get("files")
+    if isinstance(files, dict) and isinstance(files.get("SKILL.md"), str):
+        return True
     content = (
         payload.get("content")
         or payload.get("skill_md")
         or payload.get("skillMd")
     )
-    if isinstance(content, str) and content.strip():
-        return True
-    files = payload.get("files")
-    if isinstance(files, dict) and isinstance(files.get("SKILL.md"), str):
-        return True
-    return False
+    # Same as content.strip(), without copying a large SKILL.md
+    return isinstance(content, str) and bool(content) and not content.isspace()
 
 
 def _extract_version_hint(
@@ -343,6 +773,38 @@ def _extract_version_hint(
     return ""
 
 
+def _fetch_clawhub_bundle_files(
+    slug: str,
+    version: str,
+) -> dict[str, str] | None:
+    """
+    Fetch all files of a skill version with one bundle request.
+
+    Returns None if no bundle endpoint is configured or the request does
+    not yield a SKILL.md, so callers fall back to per-file requests.
+    """
+    bundle_path = _hub_bundle_path()
+    if not bundle_path:
+        return None
+    bundle_url = _join_url(_hub_base_url(), bundle_path.format(slug=slug))
+    params = {"version": version} if version else None
+    try:
+        data = _http_json_get(bundle_url, params=params)
+    except Exception as e:
+        logger.warning("Failed to fetch hub bundle %s: %s", bundle_url, e)
+        return None
+    if isinstance(data, dict) and isinstance(data.get("files"), dict):
+        data = data["files"]
+    if not isinstance(data, dict):
+        return None
+    files = {
+        path: content
+        for path, content in data.items()
+        if isinstance(path, str) and path and isinstance(content, str)
+    }
+    return files if files.get("SKILL.md") else None
+
+
 # pylint: disable-next=too-many-return-statements,too-many-branches
 def _hydrate_clawhub_payload(
     data: Any,
@@ -396,22 +858,37 @@ def _hydrate_clawhub_payload(
     version_str = str(
         version_obj.get("version") or requested_version or "",
     ).strip()
+    files = _fetch_clawhub_bundle_files(skill_slug, version_str)
+    if files is not None:
+        return {
+            "name": skill.get("displayName") or skill_slug,
+            "files": files,
+        }
+
     base = _hub_base_url()
     file_url = _join_url(base, _hub_file_path().format(slug=skill_slug))
-    files: dict[str, str] = {}
-    for item in files_meta:
-        if not isinstance(item, dict):
-            continue
-        path = item.get("path")
-        if not isinstance(path, str) or not path:
-            continue
+    paths = [
+        item["path"]
+        for item in files_meta
+        if isinstance(item, dict)
+        and isinstance(item.get("path"), str)
+        and item["path"]
+    ]
+
+    def _fetch_file(path: str) -> str | None:
         params = {"path": path}
         if version_str:
             params["version"] = version_str
         try:
-            files[path] = _http_text_get(file_url, params=params)
+            return _http_text_get(file_url, params=params)
         except Exception as e:
             logger.warning("Failed to fetch hub file %s: %s", path, e)
+            return None
+
+    files: dict[str, str] = {}
+    for path, body in zip(paths, _map_concurrently(_fetch_file, paths)):
+        if body is not None:
+            files[path] = body
 
     if not files.get("SKILL.md"):
         return data
@@ -486,18 +963,43 @@ def _normalize_bundle(
 
 
 def _safe_fallback_name(raw: str) -> str:
-    out = re.sub(r"[^a-zA-Z0-9_-]", "-", raw).strip("-_")
+    out = _FALLBACK_NAME_RE.sub("-", raw).strip("-_")
     return out or "imported-skill"
 
 
-def _is_http_url(text: str) -> bool:
-    parsed = urlparse(text.strip())
-    return parsed.scheme in {"http", "https"} and bool(parsed.netloc)
+_URL_SOURCES = {
+    "skills.sh": "skillssh",
+    "github.com": "github",
+    "skillsmp.com": "skillsmp",
+}
 
 
-def _extract_clawhub_slug_from_url(url: str) -> str:
+def _classify_url(url: str) -> tuple[str, ParseResult]:
+    """
+    Parse a hub URL once and tell which source it points to.
+
+    Returns:
+        Tuple of ("skillssh" | "github" | "skillsmp" | "clawhub" |
+        "other", parsed URL). The parsed URL can be handed to the
+        ``_extract_*`` helpers so they do not parse it again.
+    """
     parsed = urlparse(url)
     host = (parsed.netloc or "").lower()
+    if host.startswith("www."):
+        host = host[len("www.") :]
+    source = _URL_SOURCES.get(host)
+    if source is None:
+        source = "clawhub" if "clawhub.ai" in host else "other"
+    return source, parsed
+
+
+def _extract_clawhub_slug_from_url(
+    url: str,
+    parsed: ParseResult | None = None,
+) -> str:
+    if parsed is None:
+        parsed = urlparse(url)
+    host = (parsed.netloc or "").lower()
     if "clawhub.ai" not in host:
         return ""
     parts = [p for p in parsed.path.split("/") if p]
@@ -507,8 +1009,12 @@ def _extract_clawhub_slug_from_url(url: str) -> str:
     return parts[-1].strip()
 
 
-def _extract_skills_sh_spec(url: str) -> tuple[str, str, str] | None:
-    parsed = urlparse(url)
+def _extract_skills_sh_spec(
+    url: str,
+    parsed: ParseResult | None = None,
+) -> tuple[str, str, str] | None:
+    if parsed is None:
+        parsed = urlparse(url)
     host = (parsed.netloc or "").lower()
     if host not in {"skills.sh", "www.skills.sh"}:
         return None
@@ -521,8 +1027,12 @@ def _extract_skills_sh_spec(url: str) -> tuple[str, str, str] | None:
     return owner, repo, skill
 
 
-def _extract_skillsmp_slug(url: str) -> str:
-    parsed = urlparse(url)
+def _extract_skillsmp_slug(
+    url: str,
+    parsed: ParseResult | None = None,
+) -> str:
+    if parsed is None:
+        parsed = urlparse(url)
     host = (parsed.netloc or "").lower()
     if host not in {"skillsmp.com", "www.skillsmp.com"}:
         return ""
@@ -538,11 +1048,13 @@ def _extract_skillsmp_slug(url: str) -> str:
 
 def _extract_github_spec(
     url: str,
+    parsed: ParseResult | None = None,
 ) -> tuple[str, str, str, str] | None:
     """
     Parse GitHub repo/tree/blob URL into (owner, repo, branch, path_hint).
     """
-    parsed = urlparse(url)
+    if parsed is None:
+        parsed = urlparse(url)
     host = (parsed.netloc or "").lower()
     if host not in {"github.com", "www.github.com"}:
         return None
@@ -574,9 +1086,7 @@ def _github_repo_exists(owner: str, repo: str) -> bool:
 
 
 # pylint: disable-next=too-many-return-statements,too-many-branches
-def _extract_skillsmp_spec(
-    url: str,
-) -> tuple[str, str, str] | None:
+def _extract_skillsmp_spec(slug: str) -> tuple[str, str, str] | None:
     """
     Parse SkillsMP URL slug into (owner, repo, skill_hint).
 
@@ -584,7 +1094,6 @@ def _extract_skillsmp_spec(
       openclaw-openclaw-skills-himalaya-skill-md
       -> owner=openclaw, repo=openclaw-skills, skill_hint=himalaya
     """
-    slug = _extract_skillsmp_slug(url)
     if not slug:
         return None
     if slug.endswith("-skill-md"):
@@ -595,14 +1104,21 @@ def _extract_skillsmp_spec(
 
     owner = tokens[0]
     tail_tokens = tokens[1:]
-    # Try repo split points and pick the first repo that exists on GitHub.
-    # Keep requests bounded to avoid rate-limit pressure.
+    # Try repo split points and pick the longest repo that exists on
+    # GitHub. Keep requests bounded to avoid rate-limit pressure; the
+    # probes are independent, so they run concurrently.
     max_split = min(len(tail_tokens), 6)
+    candidates: list[tuple[int, str]] = []
     for i in range(max_split, 0, -1):
         repo = "-".join(tail_tokens[:i]).strip()
-        if not repo:
-            continue
-        if not _github_repo_exists(owner, repo):
+        if repo:
+            candidates.append((i, repo))
+    exists = _map_concurrently(
+        lambda candidate: _github_repo_exists(owner, candidate[1]),
+        candidates,
+    )
+    for (i, repo), repo_exists in zip(candidates, exists):
+        if not repo_exists:
             continue
         remainder = tail_tokens[i:]
         skill_hint = "-".join(remainder).strip() if remainder else ""
@@ -614,8 +1130,36 @@ def _extract_skillsmp_spec(
     return owner, repo, skill_hint
 
 
-def _resolve_clawhub_slug(bundle_url: str) -> str:
-    from_url = _extract_clawhub_slug_from_url(bundle_url)
+def _resolve_bundle_source(bundle_url: str) -> tuple[str, Any, ParseResult]:
+    """
+    Work out where a hub install URL points to, parsing it only once.
+
+    Returns:
+        Tuple of (kind, spec, parsed URL), where spec is what the fetcher
+        for kind takes: the skills.sh or GitHub spec tuple, or the
+        SkillsMP or ClawHub slug. Kind is "other" if no known source
+        matches, e.g. for direct bundle JSON URLs.
+    """
+    kind, parsed = _classify_url(bundle_url.strip())
+    spec: Any = None
+    if kind == "skillssh":
+        spec = _extract_skills_sh_spec(bundle_url, parsed)
+    elif kind == "github":
+        spec = _extract_github_spec(bundle_url, parsed)
+    elif kind == "skillsmp":
+        spec = _extract_skillsmp_slug(bundle_url, parsed)
+    elif kind == "clawhub":
+        spec = _resolve_clawhub_slug(bundle_url, parsed)
+    if not spec:
+        return "other", None, parsed
+    return kind, spec, parsed
+
+
+def _resolve_clawhub_slug(
+    bundle_url: str,
+    parsed: ParseResult | None = None,
+) -> str:
+    from_url = _extract_clawhub_slug_from_url(bundle_url, parsed)
     if from_url:
         return from_url
     return ""
@@ -637,7 +1181,34 @@ def _github_get_default_branch(owner: str, repo: str) -> str:
 
 
 def _normalize_skill_key(text: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    return _SKILL_KEY_RE.sub("-", text.lower()).strip("-")
+
+
+def _github_get_recursive_tree(owner: str, repo: str, ref: str) -> Any:
+    """
+    Get the recursive git tree listing of a repo at ref.
+
+    Listings are kept for a few minutes, so looking up skill roots and
+    bundle files of one or more skills from the same repo downloads the
+    (possibly large) tree only once. The result must not be modified.
+    """
+    key = (owner, repo, ref)
+    now = time.monotonic()
+    with _GITHUB_TREE_LOCK:
+        cached = _GITHUB_TREE_CACHE.get(key)
+        if cached is not None and now - cached[0] < _GITHUB_TREE_TTL:
+            _GITHUB_TREE_CACHE.move_to_end(key)
+            return cached[1]
+
+    tree_url = _github_api_url(owner, repo, f"git/trees/{ref}")
+    data = _http_json_get(tree_url, {"recursive": "1"})
+
+    with _GITHUB_TREE_LOCK:
+        _GITHUB_TREE_CACHE[key] = (now, data)
+        _GITHUB_TREE_CACHE.move_to_end(key)
+        while len(_GITHUB_TREE_CACHE) > _GITHUB_TREE_CACHE_SIZE:
+            _GITHUB_TREE_CACHE.popitem(last=False)
+    return data
 
 
 def _github_list_skill_md_roots(
@@ -645,8 +1216,7 @@ def _github_list_skill_md_roots(
     repo: str,
     ref: str,
 ) -> list[str]:
-    tree_url = _github_api_url(owner, repo, f"git/trees/{ref}")
-    data = _http_json_get(tree_url, {"recursive": "1"})
+    data = _github_get_recursive_tree(owner, repo, ref)
     if not isinstance(data, dict):
         return []
     tree = data.get("tree")
@@ -701,16 +1271,34 @@ def _github_get_dir_entries(
     return []
 
 
+# Raw file downloads of the skill import in progress, keyed by URL, so a
+# fallback walk does not download files it already has
+_GITHUB_DOWNLOADS: contextvars.ContextVar[
+    dict[str, str] | None
+] = contextvars.ContextVar("copaw_skills_hub_github_downloads", default=None)
+
+
+def _github_download(url: str) -> str:
+    downloads = _GITHUB_DOWNLOADS.get()
+    if downloads is None:
+        return _http_text_get(url)
+    text = downloads.get(url)
+    if text is None:
+        text = _http_text_get(url)
+        downloads[url] = text
+    return text
+
+
 def _github_read_file(entry: dict[str, Any]) -> str:
     download_url = entry.get("download_url")
     if isinstance(download_url, str) and download_url:
-        return _http_text_get(download_url)
+        return _github_download(download_url)
 
     content = entry.get("content")
     if isinstance(content, str) and content:
         try:
-            normalized = content.replace("\n", "")
-            return base64.b64decode(normalized).decode("utf-8")
+            # a2b_base64 skips the line breaks GitHub inserts
+            return binascii.a2b_base64(content).decode("utf-8")
         except Exception:
             pass
 
@@ -740,143 +1328,289 @@ def _github_collect_tree_files(
     subdir: str,
     max_files: int = 200,
 ) -> dict[str, str]:
-    files: dict[str, str] = {}
-    pending = [_join_repo_path(root, subdir)]
-    visited = 0
-    while pending:
-        current_dir = pending.pop()
+    # Walk the directories breadth-first, then download the files
+    # concurrently; entries outside ``subdir`` are never listed or fetched
+    prefix = f"{subdir.strip('/')}/"
+    found: dict[str, dict[str, Any]] = {}
+    pending = deque([_join_repo_path(root, subdir)])
+    while pending and len(found) < max_files:
+        current_dir = pending.popleft()
         entries = _github_get_dir_entries(owner, repo, current_dir, ref)
         for entry in entries:
-            entry_type = str(entry.get("type") or "")
-            entry_path = str(entry.get("path") or "")
+            entry_path = entry.get("path")
             if not entry_path:
                 continue
-            if entry_type == "dir":
-                pending.append(entry_path)
-                continue
-            if entry_type != "file":
-                continue
             rel = _relative_from_root(entry_path, root)
-            if not (
-                rel.startswith("references/") or rel.startswith("scripts/")
-            ):
+            if not rel.startswith(prefix):
                 continue
-            files[rel] = _github_read_file(entry)
-            visited += 1
-            if visited >= max_files:
-                logger.warning(
-                    "Hub file collection capped at %d files",
-                    max_files,
-                )
-                return files
-    return files
-
-
-# pylint: disable-next=too-many-branches,too-many-statements
-def _fetch_bundle_from_skills_sh_url(
-    bundle_url: str,
-    requested_version: str,
-) -> tuple[Any, str]:
-    spec = _extract_skills_sh_spec(bundle_url)
-    if spec is None:
-        raise ValueError("Invalid skills.sh URL format")
-    owner, repo, skill = spec
-    if requested_version.strip():
-        branch_candidates = [requested_version.strip()]
-    else:
-        # Avoid extra API call for default branch on every import.
-        branch_candidates = ["main", "master"]
-
-    selected_root = ""
-    skill_md_entry: dict[str, Any] | None = None
-    branch = branch_candidates[0]
-    for candidate_branch in branch_candidates:
-        branch = candidate_branch
-        roots = [
-            _join_repo_path("skills", skill),
-            skill,
-            "",
-        ]
-        for root in roots:
-            skill_md_path = _join_repo_path(root, "SKILL.md")
-            try:
-                entry = _github_get_content_entry(
-                    owner,
-                    repo,
-                    skill_md_path,
-                    branch,
-                )
-            except HTTPError as e:
-                if getattr(e, "code", 0) == 404:
-                    continue
-                raise
-            if str(entry.get("type") or "") == "file":
-                selected_root = root
-                skill_md_entry = entry
-                break
-        if skill_md_entry is not None:
-            break
-
-    if skill_md_entry is None:
-        # Fallback: discover skill roots from repo tree and fuzzy-match.
-        skill_norm = _normalize_skill_key(skill)
-        for candidate_branch in branch_candidates:
-            branch = candidate_branch
-            for root in _github_list_skill_md_roots(owner, repo, branch):
-                leaf = root.split("/")[-1] if root else root
-                leaf_norm = _normalize_skill_key(leaf)
-                if not leaf_norm:
-                    continue
-                if (
-                    leaf_norm == skill_norm
-                    or leaf_norm in skill_norm
-                    or skill_norm in leaf_norm
-                    or skill_norm.endswith(f"-{leaf_norm}")
-                ):
-                    selected_root = root
-                    skill_md_path = _join_repo_path(root, "SKILL.md")
-                    try:
-                        entry = _github_get_content_entry(
-                            owner,
-                            repo,
-                            skill_md_path,
-                            branch,
-                        )
-                    except HTTPError:
-                        continue
-                    if str(entry.get("type") or "") == "file":
-                        skill_md_entry = entry
-                        break
-            if skill_md_entry is not None:
-                break
+            entry_type = entry.get("type")
+            if entry_type == "dir":
+                pending.append(entry_path)
+            elif entry_type == "file":
+                found[rel] = entry
+                if len(found) >= max_files:
+                    logger.warning(
+                        "Hub file collection capped at %d files",
+                        max_files,
+                    )
+                    break
+    contents = _map_concurrently(_github_read_file, found.values())
+    return dict(zip(found, contents))
 
-    if skill_md_entry is None:
-        raise ValueError(
-            "Could not find SKILL.md from skills.sh source. "
-            "This skill may not expose SKILL.md in the repository.",
-        )
 
-    files: dict[str, str] = {"SKILL.md": _github_read_file(skill_md_entry)}
+def _github_walk_bundle_files(
+    owner: str,
+    repo: str,
+    ref: str,
+    root: str,
+    max_files: int = 200,
+) -> dict[str, str]:
+    files: dict[str, str] = {}
     for subdir in ("references", "scripts"):
         try:
             files.update(
                 _github_collect_tree_files(
                     owner=owner,
                     repo=repo,
-                    ref=branch,
-                    root=selected_root,
+                    ref=ref,
+                    root=root,
                     subdir=subdir,
+                    max_files=max_files,
                 ),
             )
         except HTTPError as e:
             if getattr(e, "code", 0) != 404:
                 raise
+    return files
+
+
+def _github_collect_bundle_files(
+    owner: str,
+    repo: str,
+    ref: str,
+    root: str,
+    max_files: int = 200,
+) -> dict[str, str]:
+    """
+    Collect references/ and scripts/ files of a skill under root.
+
+    Lists the whole repo with one recursive git/trees call and downloads
+    the blobs from raw.githubusercontent.com, instead of listing every
+    directory through the contents API. Falls back to the directory walk
+    if the tree is truncated or unavailable, or a raw download is not
+    found (e.g. private repositories).
+    """
+    try:
+        data = _github_get_recursive_tree(owner, repo, ref)
+    except HTTPError as e:
+        if getattr(e, "code", 0) not in (404, 409):
+            raise
+        data = None
+    tree = data.get("tree") if isinstance(data, dict) else None
+    if not isinstance(tree, list) or data.get("truncated"):
+        return _github_walk_bundle_files(owner, repo, ref, root, max_files)
+
+    prefix = f"{root.rstrip('/')}/" if root else ""
+    counts = {"references": 0, "scripts": 0}
+    raw_urls: dict[str, str] = {}
+    for item in tree:
+        if not isinstance(item, dict) or item.get("type") != "blob":
+            continue
+        path = item.get("path")
+        if not isinstance(path, str) or not path.startswith(prefix):
+            continue
+        rel = path[len(prefix) :]
+        subdir, sep, _ = rel.partition("/")
+        if not sep or subdir not in counts:
+            continue
+        if counts[subdir] >= max_files:
+            continue
+        counts[subdir] += 1
+        if counts[subdir] == max_files:
+            logger.warning(
+                "Hub file collection capped at %d files",
+                max_files,
+            )
+        raw_urls[rel] = (
+            f"https://raw.githubusercontent.com/{owner}/{repo}/"
+            f"{quote(ref)}/{quote(path)}"
+        )
+
+    try:
+        contents = _map_concurrently(_github_download, raw_urls.values())
+    except HTTPError as e:
+        if getattr(e, "code", 0) != 404:
+            raise
+        return _github_walk_bundle_files(owner, repo, ref, root, max_files)
+    return dict(zip(raw_urls, contents))
+
+
+def _probe_skill_md(
+    owner: str,
+    repo: str,
+    roots: tuple[str, ...],
+    branches: tuple[str, ...],
+) -> tuple[str, dict[str, Any], str] | None:
+    """
+    Look for SKILL.md under each root on each branch.
+
+    Branches are tried in order. On each, the first (most likely) root is
+    probed alone, so the common case costs a single API call, and only
+    on a miss are the remaining roots probed concurrently. The first hit
+    in (branch, root) order wins; 404s are skipped, other errors are
+    raised in the same order.
+
+    Returns:
+        Tuple of (root, SKILL.md entry, branch), or None if not found.
+    """
+
+    def _probe(combo: tuple[str, str]) -> Any:
+        branch, root = combo
+        try:
+            return _github_get_content_entry(
+                owner,
+                repo,
+                _join_repo_path(root, "SKILL.md"),
+                branch,
+            )
+        except Exception as e:  # re-raised below in probe order
+            return e
+
+    for branch in branches:
+        for stage in (roots[:1], roots[1:]):
+            combos = [(branch, root) for root in stage]
+            for (_, root), result in zip(
+                combos,
+                _map_concurrently(_probe, combos),
+            ):
+                if isinstance(result, HTTPError) and result.code == 404:
+                    continue
+                if isinstance(result, Exception):
+                    raise result
+                if str(result.get("type") or "") == "file":
+                    return root, result, branch
+    return None
+
+
+def _search_skill_md(
+    owner: str,
+    repo: str,
+    skill: str,
+    branches: tuple[str, ...],
+) -> tuple[str, dict[str, Any], str] | None:
+    """
+    Discover skill roots from the repo tree and fuzzy-match the skill.
+
+    Returns:
+        Tuple of (root, SKILL.md entry, branch), or None if not found.
+    """
+    skill_norm = _normalize_skill_key(skill)
+    for branch in branches:
+        try:
+            roots = _github_list_skill_md_roots(owner, repo, branch)
+        except HTTPError as e:
+            # The branch does not exist
+            if e.code in (404, 409):
+                continue
+            raise
+        for root in roots:
+            leaf = root.split("/")[-1] if root else root
+            leaf_norm = _normalize_skill_key(leaf)
+            if not leaf_norm:
+                continue
+            if not skill_norm or (
+                leaf_norm == skill_norm
+                or leaf_norm in skill_norm
+                or skill_norm in leaf_norm
+                or skill_norm.endswith(f"-{leaf_norm}")
+            ):
+                skill_md_path = _join_repo_path(root, "SKILL.md")
+                try:
+                    entry = _github_get_content_entry(
+                        owner,
+                        repo,
+                        skill_md_path,
+                        branch,
+                    )
+                except HTTPError:
+                    continue
+                if str(entry.get("type") or "") == "file":
+                    return root, entry, branch
+    return None
+
+
+def _locate_skill_md(
+    owner: str,
+    repo: str,
+    skill: str,
+    requested_version: str,
+) -> tuple[str, dict[str, Any], str] | None:
+    """
+    Find the SKILL.md of a skill in a GitHub repo.
+
+    Tries the usual skill roots on the requested branch (or main and
+    master), then the repo's actual default branch if neither exists,
+    and finally fuzzy-matches all skill roots in the repo tree.
+
+    Returns:
+        Tuple of (root, SKILL.md entry, branch), or None if not found.
+    """
+    requested_branch = requested_version.strip()
+    # Avoid extra API call for default branch on every import.
+    branches = (requested_branch,) if requested_branch else ("main", "master")
+    if skill:
+        roots = (_join_repo_path("skills", skill), skill, "")
+    else:
+        roots = ("",)
+
+    located = _probe_skill_md(owner, repo, roots, branches)
+    if located is None and not requested_branch:
+        # Neither guess found it; ask for the default branch once
+        try:
+            default_branch = _github_get_default_branch(owner, repo)
+        except Exception as e:
+            logger.debug("Failed to get default branch: %s", e)
+            default_branch = ""
+        if default_branch and default_branch not in branches:
+            branches += (default_branch,)
+            located = _probe_skill_md(owner, repo, roots, (default_branch,))
+    if located is None:
+        located = _search_skill_md(owner, repo, skill, branches)
+    return located
+
+
+def _fetch_bundle_from_skills_sh(
+    spec: tuple[str, str, str],
+    requested_version: str,
+) -> tuple[Any, str]:
+    owner, repo, skill = spec
+
+    located = _locate_skill_md(owner, repo, skill, requested_version)
+    if located is None:
+        raise ValueError(
+            "Could not find SKILL.md from skills.sh source. "
+            "This skill may not expose SKILL.md in the repository.",
+        )
+    selected_root, skill_md_entry, branch = located
+
+    token = _GITHUB_DOWNLOADS.set({})
+    try:
+        files = {"SKILL.md": _github_read_file(skill_md_entry)}
+        files.update(
+            _github_collect_bundle_files(
+                owner=owner,
+                repo=repo,
+                ref=branch,
+                root=selected_root,
+            ),
+        )
+    finally:
+        _GITHUB_DOWNLOADS.reset(token)
 
     source_url = f"https://github.com/{owner}/{repo}"
     return {"name": skill, "files": files}, source_url
 
 
-# pylint: disable-next=too-many-branches,too-many-statements
 def _fetch_bundle_from_repo_and_skill_hint(
     *,
     owner: str,
@@ -884,106 +1618,35 @@ def _fetch_bundle_from_repo_and_skill_hint(
     skill_hint: str,
     requested_version: str,
 ) -> tuple[Any, str]:
-    branch_candidates = (
-        [requested_version.strip()]
-        if requested_version.strip()
-        else ["main", "master"]
-    )
     skill = skill_hint.strip()
 
-    selected_root = ""
-    skill_md_entry: dict[str, Any] | None = None
-    branch = branch_candidates[0]
-    for candidate_branch in branch_candidates:
-        branch = candidate_branch
-        roots = [
-            _join_repo_path("skills", skill) if skill else "",
-            skill,
-            "",
-        ]
-        roots = [r for r in roots if r or r == ""]
-        for root in roots:
-            skill_md_path = _join_repo_path(root, "SKILL.md")
-            try:
-                entry = _github_get_content_entry(
-                    owner,
-                    repo,
-                    skill_md_path,
-                    branch,
-                )
-            except HTTPError as e:
-                if getattr(e, "code", 0) == 404:
-                    continue
-                raise
-            if str(entry.get("type") or "") == "file":
-                selected_root = root
-                skill_md_entry = entry
-                break
-        if skill_md_entry is not None:
-            break
-
-    if skill_md_entry is None:
-        skill_norm = _normalize_skill_key(skill)
-        for candidate_branch in branch_candidates:
-            branch = candidate_branch
-            for root in _github_list_skill_md_roots(owner, repo, branch):
-                leaf = root.split("/")[-1] if root else root
-                leaf_norm = _normalize_skill_key(leaf)
-                if not leaf_norm:
-                    continue
-                if not skill_norm or (
-                    leaf_norm == skill_norm
-                    or leaf_norm in skill_norm
-                    or skill_norm in leaf_norm
-                    or skill_norm.endswith(f"-{leaf_norm}")
-                ):
-                    selected_root = root
-                    skill_md_path = _join_repo_path(root, "SKILL.md")
-                    try:
-                        entry = _github_get_content_entry(
-                            owner,
-                            repo,
-                            skill_md_path,
-                            branch,
-                        )
-                    except HTTPError:
-                        continue
-                    if str(entry.get("type") or "") == "file":
-                        skill_md_entry = entry
-                        break
-            if skill_md_entry is not None:
-                break
-
-    if skill_md_entry is None:
+    located = _locate_skill_md(owner, repo, skill, requested_version)
+    if located is None:
         raise ValueError("Could not find SKILL.md in source repository")
+    selected_root, skill_md_entry, branch = located
 
-    files: dict[str, str] = {"SKILL.md": _github_read_file(skill_md_entry)}
-    for subdir in ("references", "scripts"):
-        try:
-            files.update(
-                _github_collect_tree_files(
-                    owner=owner,
-                    repo=repo,
-                    ref=branch,
-                    root=selected_root,
-                    subdir=subdir,
-                ),
-            )
-        except HTTPError as e:
-            if getattr(e, "code", 0) != 404:
-                raise
+    token = _GITHUB_DOWNLOADS.set({})
+    try:
+        files = {"SKILL.md": _github_read_file(skill_md_entry)}
+        files.update(
+            _github_collect_bundle_files(
+                owner=owner,
+                repo=repo,
+                ref=branch,
+                root=selected_root,
+            ),
+        )
+    finally:
+        _GITHUB_DOWNLOADS.reset(token)
     source_url = f"https://github.com/{owner}/{repo}"
     skill_name = skill.split("/")[-1].strip() if skill else repo
     return {"name": skill_name or repo, "files": files}, source_url
 
 
-def _fetch_bundle_from_github_url(
-    bundle_url: str,
+def _fetch_bundle_from_github(
+    spec: tuple[str, str, str, str],
     requested_version: str,
 ) -> tuple[Any, str]:
-    spec = _extract_github_spec(bundle_url)
-    if spec is None:
-        raise ValueError("Invalid GitHub URL format")
     owner, repo, branch_in_url, path_hint = spec
     path_hint = path_hint.strip("/")
     # If path points directly to SKILL.md, normalize to its parent directory.
@@ -1000,11 +1663,11 @@ def _fetch_bundle_from_github_url(
     )
 
 
-def _fetch_bundle_from_skillsmp_url(
-    bundle_url: str,
+def _fetch_bundle_from_skillsmp(
+    slug: str,
     requested_version: str,
 ) -> tuple[Any, str]:
-    spec = _extract_skillsmp_spec(bundle_url)
+    spec = _extract_skillsmp_spec(slug)
     if spec is None:
         raise ValueError("Invalid skillsmp URL format")
     owner, repo, skill_hint = spec
@@ -1031,7 +1694,7 @@ def _fetch_bundle_from_clawhub_slug(
     source_url = ""
     for candidate in candidates:
         try:
-            data = _http_json_get(candidate)
+            data = _cached_json_get(candidate)
             source_url = candidate
             break
         except Exception as e:
@@ -1050,101 +1713,128 @@ def _fetch_bundle_from_clawhub_slug(
     )
 
 
+# Bundle fetcher per _resolve_bundle_source kind, called with its spec and
+# the requested version
+_BUNDLE_FETCHERS: dict[str, Callable[[Any, str], tuple[Any, str]]] = {
+    "skillssh": _fetch_bundle_from_skills_sh,
+    "github": _fetch_bundle_from_github,
+    "skillsmp": _fetch_bundle_from_skillsmp,
+    "clawhub": _fetch_bundle_from_clawhub_slug,
+}
+
+
+def _first_str(item: dict[str, Any], *keys: str, default: str = "") -> str:
+    """Return the first truthy value of keys in item as str."""
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return value if isinstance(value, str) else str(value)
+    return default
+
+
 def search_hub_skills(query: str, limit: int = 20) -> list[HubSkillResult]:
     base = _hub_base_url()
     search_url = _join_url(base, _hub_search_path())
-    data = _http_json_get(search_url, {"q": query, "limit": limit})
+    data = _cached_json_get(search_url, {"q": query, "limit": limit})
     items = _norm_search_items(data)
     results: list[HubSkillResult] = []
     for item in items:
-        slug = str(item.get("slug") or item.get("name") or "").strip()
+        slug = _first_str(item, "slug", "name").strip()
         if not slug:
             continue
         results.append(
             HubSkillResult(
                 slug=slug,
-                name=str(
-                    item.get("name") or item.get("displayName") or slug,
-                ),
-                description=str(
-                    item.get("description") or item.get("summary") or "",
-                ),
-                version=str(item.get("version") or ""),
-                source_url=str(item.get("url") or ""),
+                name=_first_str(item, "name", "displayName", default=slug),
+                description=_first_str(item, "description", "summary"),
+                version=_first_str(item, "version"),
+                source_url=_first_str(item, "url"),
             ),
         )
     return results
 
 
-# pylint: disable-next=too-many-branches
 def install_skill_from_hub(
     *,
     bundle_url: str,
     version: str = "",
     enable: bool = True,
     overwrite: bool = False,
+) -> HubInstallResult:
+    # Identical installs already running are joined instead of repeated;
+    # their callers get the same result or exception
+    key = (bundle_url.strip(), version.strip(), enable, overwrite)
+    with _INSTALLS_IN_FLIGHT_LOCK:
+        in_flight = _INSTALLS_IN_FLIGHT.get(key)
+        if in_flight is None:
+            future: Future = Future()
+            _INSTALLS_IN_FLIGHT[key] = future
+    if in_flight is not None:
+        return in_flight.result()
+
+    try:
+        result = _install_skill_from_hub(
+            bundle_url=bundle_url,
+            version=version,
+            enable=enable,
+            overwrite=overwrite,
+        )
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INSTALLS_IN_FLIGHT_LOCK:
+            _INSTALLS_IN_FLIGHT.pop(key, None)
+    future.set_result(result)
+    return result
+
+
+def _install_skill_from_hub(
+    *,
+    bundle_url: str,
+    version: str = "",
+    enable: bool = True,
+    overwrite: bool = False,
 ) -> HubInstallResult:
     source_url = bundle_url
     data: Any
 
-    if not bundle_url or not _is_http_url(bundle_url):
+    kind, spec, parsed = _resolve_bundle_source(bundle_url)
+    if parsed.scheme not in {"http", "https"} or not parsed.netloc:
         raise ValueError("bundle_url must be a valid http(s) URL")
 
-    skills_spec = _extract_skills_sh_spec(bundle_url)
-    if skills_spec is not None:
-        data, source_url = _fetch_bundle_from_skills_sh_url(
-            bundle_url,
-            requested_version=version,
-        )
+    fetch_bundle = _BUNDLE_FETCHERS.get(kind)
+    if fetch_bundle is not None:
+        data, source_url = fetch_bundle(spec, version)
     else:
-        github_spec = _extract_github_spec(bundle_url)
-        if github_spec is not None:
-            data, source_url = _fetch_bundle_from_github_url(
-                bundle_url,
-                requested_version=version,
-            )
-        else:
-            skillsmp_slug = _extract_skillsmp_slug(bundle_url)
-            if skillsmp_slug:
-                data, source_url = _fetch_bundle_from_skillsmp_url(
-                    bundle_url,
-                    requested_version=version,
-                )
-            else:
-                clawhub_slug = _resolve_clawhub_slug(bundle_url)
-                if clawhub_slug:
-                    data, source_url = _fetch_bundle_from_clawhub_slug(
-                        clawhub_slug,
-                        version,
-                    )
-                else:
-                    # Backward-compatible fallback for direct bundle JSON URLs
-                    data = _http_json_get(bundle_url)
+        # Backward-compatible fallback for direct bundle JSON URLs
+        data = _http_json_get(bundle_url)
 
     name, content, references, scripts, extra_files = _normalize_bundle(data)
     if not name:
-        fallback = urlparse(bundle_url).path.strip("/").split("/")[-1]
+        fallback = parsed.path.strip("/").split("/")[-1]
         name = _safe_fallback_name(fallback)
 
-    created = SkillService.create_skill(
-        name=name,
-        content=content,
-        overwrite=overwrite,
-        references=references,
-        scripts=scripts,
-        extra_files=extra_files,
-    )
-    if not created:
-        raise RuntimeError(
-            f"Failed to create skill '{name}'. "
-            "Try overwrite=true if it already exists.",
+    with _SKILL_WRITE_LOCK:
+        created = SkillService.create_skill(
+            name=name,
+            content=content,
+            overwrite=overwrite,
+            references=references,
+            scripts=scripts,
+            extra_files=extra_files,
         )
+        if not created:
+            raise RuntimeError(
+                f"Failed to create skill '{name}'. "
+                "Try overwrite=true if it already exists.",
+            )
 
-    enabled = False
-    if enable:
-        enabled = SkillService.enable_skill(name, force=True)
-        if not enabled:
-            logger.warning("Skill '%s' imported but enable failed", name)
+        enabled = False
+        if enable:
+            enabled = SkillService.enable_skill(name, force=True)
+    if enable and not enabled:
+        logger.warning("Skill '%s' imported but enable failed", name)
 
     return HubInstallResult(
         name=name,
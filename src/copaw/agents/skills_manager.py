@@ -327,6 +327,76 @@ def list_available_skills() -> list[str]:
     ]
 
 
+# SKILL.md path -> ((mtime_ns, size), (name, description)) of its front
+# matter, so unchanged skills are not parsed again for every agent
+_SKILL_METADATA_CACHE: dict[str, tuple[tuple[int, int], tuple[str, str]]] = {}
+
+
+def _load_skill_metadata(skill_md: Path) -> tuple[str, str]:
+    """Read name and description from a SKILL.md front matter.
+
+    Args:
+        skill_md: Path to the SKILL.md file
+
+    Returns:
+        Tuple of (name, description)
+
+    Raises:
+        ValueError: If the front matter lacks `name` or `description`
+    """
+    stat = skill_md.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _SKILL_METADATA_CACHE.get(str(skill_md))
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with open(skill_md, "r", encoding="utf-8") as f:
+        post = frontmatter.load(f)
+    name = post.get("name", None)
+    description = post.get("description", None)
+    if not name or not description:
+        raise ValueError(
+            f"The SKILL.md file in '{skill_md.parent}' must have a YAML "
+            "Front Matter including `name` and `description` fields.",
+        )
+
+    metadata = (str(name), str(description))
+    _SKILL_METADATA_CACHE[str(skill_md)] = (signature, metadata)
+    return metadata
+
+
+def list_available_skills_metadata() -> list[tuple[str, str, Path]]:
+    """
+    List name, description and directory of all available skills.
+
+    Front matter is only parsed again when a SKILL.md file changed.
+    Skills with invalid front matter are logged and skipped.
+
+    Returns:
+        List of (name, description, skill_dir) tuples.
+    """
+    active_skills = get_active_skills_dir()
+    if not active_skills.exists():
+        return []
+
+    skills = []
+    for skill_dir in active_skills.iterdir():
+        skill_md = skill_dir / "SKILL.md"
+        if not skill_dir.is_dir() or not skill_md.is_file():
+            continue
+        try:
+            name, description = _load_skill_metadata(skill_md)
+        except Exception as e:
+            logger.error(
+                "Failed to load skill '%s': %s",
+                skill_dir.name,
+                e,
+            )
+            continue
+        skills.append((name, description, skill_dir))
+    return skills
+
+
 def ensure_skills_initialized() -> None:
     """
     Check if skills are initialized in active_skills directory.
@@ -18,6 +18,7 @@ from .file_handling import (
 
 # Message processing
 from .message_processing import (
+    has_file_or_media_blocks,
     is_first_user_interaction,
     prepend_to_message_content,
     process_file_and_media_blocks_in_message,
@@ -42,6 +43,7 @@ from .tool_message_utils import (
     _sanitize_tool_messages,
     check_valid_messages,
     extract_tool_ids,
+    find_keep_boundary,
 )
 
 __all__ = [
@@ -49,6 +51,7 @@ __all__ = [
     "download_file_from_base64",
     "download_file_from_url",
     # Message processing
+    "has_file_or_media_blocks",
     "process_file_and_media_blocks_in_message",
     "is_first_user_interaction",
     "prepend_to_message_content",
@@ -66,4 +69,5 @@ __all__ = [
     "_sanitize_tool_messages",
     "check_valid_messages",
     "extract_tool_ids",
+    "find_keep_boundary",
 ]
@@ -6,6 +6,7 @@ This module handles:
 - Message content manipulation
 - Message validation
 """
+import itertools
 import logging
 import os
 import urllib.parse
@@ -227,6 +228,33 @@ async def _process_single_block(
         return None
 
 
+# Block types that process_file_and_media_blocks_in_message downloads
+_FILE_AND_MEDIA_BLOCK_TYPES = frozenset({"file", "image", "audio", "video"})
+
+
+def has_file_or_media_blocks(msg) -> bool:
+    """
+    Check if messages contain file or media blocks that need processing.
+
+    Args:
+        msg: The message object (Msg or list[Msg]) to check.
+
+    Returns:
+        bool: True if process_file_and_media_blocks_in_message has work to
+            do on the messages.
+    """
+    messages = (
+        [msg] if isinstance(msg, Msg) else msg if isinstance(msg, list) else []
+    )
+    return any(
+        isinstance(block, dict)
+        and block.get("type") in _FILE_AND_MEDIA_BLOCK_TYPES
+        for message in messages
+        if isinstance(message, Msg) and isinstance(message.content, list)
+        for block in message.content
+    )
+
+
 async def process_file_and_media_blocks_in_message(msg) -> None:
     """
     Process file and media blocks (file, image, audio, video) in messages.
@@ -246,26 +274,37 @@ async def process_file_and_media_blocks_in_message(msg) -> None:
         if not isinstance(message.content, list):
             continue
 
-        downloaded_files = []
+        downloaded_files: dict[int, str] = {}
 
         for i, block in enumerate(message.content):
             if not isinstance(block, dict):
                 continue
 
             block_type = block.get("type")
-            if block_type not in ["file", "image", "audio", "video"]:
+            if block_type not in _FILE_AND_MEDIA_BLOCK_TYPES:
                 continue
 
             local_path = await _process_single_block(message.content, i, block)
             if local_path:
-                downloaded_files.append((i, local_path))
+                downloaded_files[i] = local_path
 
-        for i, local_path in reversed(downloaded_files):
-            text_block = {
-                "type": "text",
-                "text": f"用户上传文件，已经下载到 {local_path}",
-            }
-            message.content.insert(i + 1, text_block)
+        if not downloaded_files:
+            continue
+
+        # Rebuild the content in one pass instead of inserting each
+        # notice into the middle of the list
+        new_content = []
+        for i, block in enumerate(message.content):
+            new_content.append(block)
+            local_path = downloaded_files.get(i)
+            if local_path:
+                new_content.append(
+                    {
+                        "type": "text",
+                        "text": f"用户上传文件，已经下载到 {local_path}",
+                    },
+                )
+        message.content[:] = new_content
 
 
 def is_first_user_interaction(messages: list) -> bool:
@@ -279,16 +318,20 @@ def is_first_user_interaction(messages: list) -> bool:
               responses.
     """
     system_prompt_count = sum(1 for msg in messages if msg.role == "system")
-    non_system_messages = messages[system_prompt_count:]
-
-    user_msg_count = sum(
-        1 for msg in non_system_messages if msg.role == "user"
-    )
-    assistant_msg_count = sum(
-        1 for msg in non_system_messages if msg.role == "assistant"
-    )
 
-    return user_msg_count == 1 and assistant_msg_count == 0
+    # Stop at the first assistant or second user message instead of
+    # counting them over the whole memory
+    user_msg_count = 0
+    for msg in itertools.islice(messages, system_prompt_count, None):
+        role = msg.role
+        if role == "assistant":
+            return False
+        if role == "user":
+            user_msg_count += 1
+            if user_msg_count > 1:
+                return False
+
+    return user_msg_count == 1
 
 
 def prepend_to_message_content(msg, guidance: str) -> None:
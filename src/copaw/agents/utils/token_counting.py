@@ -5,12 +5,18 @@ This module provides token counting functionality for estimating
 message token usage with Qwen tokenizer.
 """
 import logging
+from collections import OrderedDict
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 _token_counter = None
 
+# LRU of (text length, text hash) -> token count for message prompts.
+# Keyed by fingerprint so the cache does not keep large prompts alive.
+_TOKEN_COUNT_CACHE_SIZE = 256
+_token_count_cache: "OrderedDict[tuple[int, int], int]" = OrderedDict()
+
 
 def _get_token_counter():
     """Get or initialize the global token counter instance.
@@ -86,6 +92,65 @@ def _extract_text_from_messages(messages: list[dict]) -> str:
     return "\n".join(parts)
 
 
+def _estimate_tokens(messages: list[dict]) -> int:
+    """Estimate tokens in messages as character count // 4.
+
+    Walks the same content as ``_extract_text_from_messages`` but only
+    sums lengths, so no concatenated string is built on the fallback path.
+
+    Args:
+        messages: List of message dictionaries in chat format.
+
+    Returns:
+        int: The estimated number of tokens in the messages.
+    """
+    n_chars = 0
+    n_parts = 0
+    for msg in messages:
+        content = msg.get("content", "")
+        if isinstance(content, str):
+            n_chars += len(content)
+            n_parts += 1
+        elif isinstance(content, list):
+            for block in content:
+                if isinstance(block, dict):
+                    text = block.get("text") or block.get("content", "")
+                    if text:
+                        n_chars += len(
+                            text if isinstance(text, str) else str(text),
+                        )
+                        n_parts += 1
+                elif isinstance(block, str):
+                    n_chars += len(block)
+                    n_parts += 1
+    # Account for the "\n" separators between parts
+    n_chars += max(n_parts - 1, 0)
+    return n_chars // 4
+
+
+def _count_text_tokens_cached(text: str) -> int:
+    """Count tokens in text, reusing results for recently seen texts.
+
+    Args:
+        text: The text to count tokens for.
+
+    Returns:
+        int: The number of tokens in the text.
+    """
+    key = (len(text), hash(text))
+    token_count = _token_count_cache.get(key)
+    if token_count is not None:
+        _token_count_cache.move_to_end(key)
+        return token_count
+
+    token_counter = _get_token_counter()
+    token_count = len(token_counter.tokenizer.encode(text))
+    _token_count_cache[key] = token_count
+    if len(_token_count_cache) > _TOKEN_COUNT_CACHE_SIZE:
+        _token_count_cache.popitem(last=False)
+    return token_count
+
+
 async def count_message_tokens(
     messages: list[dict],
 ) -> int:
@@ -104,10 +169,8 @@ async def count_message_tokens(
     Raises:
         RuntimeError: If token counter fails to initialize.
     """
-    token_counter = _get_token_counter()
     text = _extract_text_from_messages(messages)
-    token_ids = token_counter.tokenizer.encode(text)
-    token_count = len(token_ids)
+    token_count = _count_text_tokens_cached(text)
     logger.debug(
         "Counted %d tokens in %d messages",
         token_count,
@@ -135,8 +198,7 @@ async def safe_count_message_tokens(
         return await count_message_tokens(messages)
     except Exception as e:
         # Fallback to character-based estimation
-        text = _extract_text_from_messages(messages)
-        estimated_tokens = len(text) // 4
+        estimated_tokens = _estimate_tokens(messages)
         logger.warning(
             "Failed to count tokens: %s, using estimated_tokens=%d",
             e,
@@ -53,6 +53,40 @@ def check_valid_messages(messages: list) -> bool:
     return use_ids == result_ids
 
 
+def find_keep_boundary(messages: list, max_keep: int) -> int:
+    """Find the largest valid suffix length of messages, up to max_keep.
+
+    Equivalent to decreasing ``keep`` from ``max_keep`` until
+    ``check_valid_messages(messages[-keep:])`` holds, but done in a single
+    backward scan without slicing.
+
+    Args:
+        messages: List of Msg objects.
+        max_keep: Maximum number of trailing messages to keep.
+
+    Returns:
+        int: Length of the longest valid suffix (0 if none).
+    """
+    use_ids: set[str] = set()
+    result_ids: set[str] = set()
+    # Number of ids present in exactly one of use_ids / result_ids
+    mismatched = 0
+    best = 0
+    for keep in range(1, min(max_keep, len(messages)) + 1):
+        u, r = extract_tool_ids(messages[-keep])
+        for uid in u:
+            if uid not in use_ids:
+                use_ids.add(uid)
+                mismatched += -1 if uid in result_ids else 1
+        for rid in r:
+            if rid not in result_ids:
+                result_ids.add(rid)
+                mismatched += -1 if rid in use_ids else 1
+        if mismatched == 0:
+            best = keep
+    return best
+
+
 def _reorder_tool_results(msgs: list) -> list:
     """Move tool_result messages right after their corresponding tool_use.
 
@@ -147,33 +181,150 @@ def _remove_unpaired_tool_messages(msgs: list) -> list:
     return [msg for idx, msg in enumerate(msgs) if idx not in to_remove]
 
 
-def _dedup_tool_blocks(msgs: list) -> list:
-    """Remove duplicate tool_use blocks (same ID) within a single message."""
-    changed = False
-    result: list = []
-    for msg in msgs:
-        if not isinstance(msg.content, list):
-            result.append(msg)
+def _is_valid_tool_block(block: dict) -> bool:
+    """Check that a tool_use/tool_result block has a valid id/name.
+
+    Blocks of other types are always valid. Invalid blocks are logged.
+    """
+    block_type = block.get("type")
+    if block_type not in ("tool_use", "tool_result"):
+        return True
+
+    block_id = block.get("id")
+    block_name = block.get("name")
+
+    # Check if id is valid (not None, not empty string)
+    if not block_id:
+        logger.warning(
+            "Removing %s with invalid id: id=%r, name=%r",
+            block_type,
+            block_id,
+            block_name,
+        )
+        return False
+
+    # For tool_use, also check name is non-empty
+    if block_type == "tool_use" and not block_name:
+        logger.warning(
+            "Removing tool_use with invalid name: id=%r, name=%r",
+            block_id,
+            block_name,
+        )
+        return False
+
+    return True
+
+
+def _repair_tool_input(block: dict) -> bool:
+    """Fill an empty tool_use input from its raw_input, in place.
+
+    Returns:
+        True if the block was repaired.
+    """
+    if block.get("type") != "tool_use":
+        return False
+
+    input_field = block.get("input", {})
+    raw_input = block.get("raw_input", "")
+
+    # If input is empty but raw_input has content, try to parse
+    if not input_field and raw_input and raw_input != "{}":
+        try:
+            parsed = json.loads(raw_input)
+            if isinstance(parsed, dict) and parsed:
+                # Success! Update the input field
+                block["input"] = parsed
+                logger.info(
+                    "Repaired tool_use input from raw_input: "
+                    "id=%s, name=%s, keys=%s",
+                    block.get("id"),
+                    block.get("name"),
+                    list(parsed.keys()),
+                )
+                return True
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.warning(
+                "Failed to repair tool_use input from raw_input: "
+                "id=%s, name=%s, error=%s",
+                block.get("id"),
+                block.get("name"),
+                e,
+            )
+    return False
+
+
+def _apply_tool_block_rules(
+    msg,
+    repair: bool = True,
+    validate: bool = True,
+    dedup: bool = True,
+) -> tuple[bool, set[str], set[str]]:
+    """Apply the tool block cleanup rules to a single message in place.
+
+    This is the one place the rules live: repairing empty tool_use inputs
+    (``_repair_tool_input``), dropping blocks with an invalid id/name
+    (``_is_valid_tool_block``) and dropping repeated tool_use IDs, all in
+    one scan of the content.
+
+    Args:
+        msg: A Msg object whose content may contain tool blocks.
+        repair: Repair empty tool_use inputs from raw_input.
+        validate: Remove tool blocks with invalid id/name.
+        dedup: Remove tool_use blocks whose ID appeared earlier.
+
+    Returns:
+        A tuple of (changed, tool_use IDs, tool_result IDs), where the IDs
+        are those of the kept blocks, as returned by extract_tool_ids.
+    """
+    uses: set[str] = set()
+    results: set[str] = set()
+    if not isinstance(msg.content, list):
+        return False, uses, results
+
+    new_blocks: list = []
+    repaired = False
+    removed = False
+    for block in msg.content:
+        if not isinstance(block, dict):
+            new_blocks.append(block)
             continue
-        seen_ids: set[str] = set()
-        new_blocks: list = []
-        deduped = False
-        for block in msg.content:
-            if (
-                isinstance(block, dict)
-                and block.get("type") == "tool_use"
-                and block.get("id")
-            ):
-                if block["id"] in seen_ids:
-                    deduped = True
+        if repair and _repair_tool_input(block):
+            repaired = True
+        if validate and not _is_valid_tool_block(block):
+            removed = True
+            continue
+        block_id = block.get("id")
+        if block_id:
+            btype = block.get("type")
+            if btype == "tool_use":
+                if dedup and block_id in uses:
+                    removed = True
                     continue
-                seen_ids.add(block["id"])
-            new_blocks.append(block)
-        if deduped:
-            msg.content = new_blocks
+                uses.add(block_id)
+            elif btype == "tool_result":
+                results.add(block_id)
+        new_blocks.append(block)
+
+    if removed:
+        msg.content = new_blocks
+    return repaired or removed, uses, results
+
+
+def _apply_tool_block_rules_to_all(msgs: list, **rules: bool) -> list:
+    """Apply ``_apply_tool_block_rules`` to every message.
+
+    Returns the original list unchanged if no message changed.
+    """
+    changed = False
+    for msg in msgs:
+        if _apply_tool_block_rules(msg, **rules)[0]:
             changed = True
-        result.append(msg)
-    return result if changed else msgs
+    return list(msgs) if changed else msgs
+
+
+def _dedup_tool_blocks(msgs: list) -> list:
+    """Remove duplicate tool_use blocks (same ID) within a single message."""
+    return _apply_tool_block_rules_to_all(msgs, repair=False, validate=False)
 
 
 def _remove_invalid_tool_blocks(msgs: list) -> list:
@@ -192,59 +343,7 @@ def _remove_invalid_tool_blocks(msgs: list) -> list:
     Returns:
         List of Msg objects with invalid tool blocks removed.
     """
-    changed = False
-    result: list = []
-
-    for msg in msgs:
-        if not isinstance(msg.content, list):
-            result.append(msg)
-            continue
-
-        new_blocks: list = []
-        removed = False
-
-        for block in msg.content:
-            if not isinstance(block, dict):
-                new_blocks.append(block)
-                continue
-
-            block_type = block.get("type")
-
-            # Validate tool_use and tool_result blocks
-            if block_type in ("tool_use", "tool_result"):
-                block_id = block.get("id")
-                block_name = block.get("name")
-
-                # Check if id is valid (not None, not empty string)
-                if not block_id:
-                    logger.warning(
-                        "Removing %s with invalid id: id=%r, name=%r",
-                        block_type,
-                        block_id,
-                        block_name,
-                    )
-                    removed = True
-                    continue
-
-                # For tool_use, also check name is non-empty
-                if block_type == "tool_use" and not block_name:
-                    logger.warning(
-                        "Removing tool_use with invalid name: id=%r, name=%r",
-                        block_id,
-                        block_name,
-                    )
-                    removed = True
-                    continue
-
-            new_blocks.append(block)
-
-        if removed:
-            msg.content = new_blocks
-            changed = True
-
-        result.append(msg)
-
-    return result if changed else msgs
+    return _apply_tool_block_rules_to_all(msgs, repair=False, dedup=False)
 
 
 def _repair_empty_tool_inputs(
@@ -262,61 +361,25 @@ def _repair_empty_tool_inputs(
     Returns:
         List of Msg objects with repaired tool_use blocks.
     """
-    # pylint: disable=too-many-nested-blocks
-    changed = False
-    result: list = []
+    return _apply_tool_block_rules_to_all(msgs, validate=False, dedup=False)
 
-    for msg in msgs:
-        if not isinstance(msg.content, list):
-            result.append(msg)
-            continue
-
-        new_blocks: list = []
-        repaired = False
 
-        for block in msg.content:
-            if not isinstance(block, dict):
-                new_blocks.append(block)
-                continue
+def _clean_tool_blocks(msg) -> tuple[set[str], set[str]]:
+    """Clean the tool blocks of a single message in place.
 
-            # Check if this is a tool_use with empty input but valid raw_input
-            if block.get("type") == "tool_use":
-                input_field = block.get("input", {})
-                raw_input = block.get("raw_input", "")
-
-                # If input is empty but raw_input has content, try to parse
-                if not input_field and raw_input and raw_input != "{}":
-                    try:
-                        parsed = json.loads(raw_input)
-                        if isinstance(parsed, dict) and parsed:
-                            # Success! Update the input field
-                            block["input"] = parsed
-                            repaired = True
-                            logger.info(
-                                "Repaired tool_use input from raw_input: "
-                                "id=%s, name=%s, keys=%s",
-                                block.get("id"),
-                                block.get("name"),
-                                list(parsed.keys()),
-                            )
-                    except (json.JSONDecodeError, TypeError) as e:
-                        logger.warning(
-                            "Failed to repair tool_use input from raw_input: "
-                            "id=%s, name=%s, error=%s",
-                            block.get("id"),
-                            block.get("name"),
-                            e,
-                        )
+    Equivalent to running _repair_empty_tool_inputs,
+    _remove_invalid_tool_blocks and _dedup_tool_blocks on the message,
+    in one scan of its content.
 
-            new_blocks.append(block)
-
-        if repaired:
-            msg.content = new_blocks
-            changed = True
-
-        result.append(msg)
+    Args:
+        msg: A Msg object whose content may contain tool blocks.
 
-    return result if changed else msgs
+    Returns:
+        A tuple of two sets: (tool_use IDs, tool_result IDs) of the
+        cleaned message, as returned by extract_tool_ids.
+    """
+    _, uses, results = _apply_tool_block_rules(msg)
+    return uses, results
 
 
 def _sanitize_tool_messages(msgs: list) -> list:
@@ -324,17 +387,13 @@ def _sanitize_tool_messages(msgs: list) -> list:
 
     Returns the original list unchanged if no fix is needed.
     """
-    # First, repair tool_use blocks with empty input but valid raw_input
-    msgs = _repair_empty_tool_inputs(msgs)
-    # Then, remove invalid tool blocks (empty id, None name, etc.)
-    msgs = _remove_invalid_tool_blocks(msgs)
-    # Finally, remove duplicate tool blocks
-    msgs = _dedup_tool_blocks(msgs)
+    # Repair, validate and dedup the blocks of every message in a single
+    # pass, collecting the tool ids for the pairing check on the way
+    tool_ids = [_clean_tool_blocks(msg) for msg in msgs]
 
     pending: dict[str, int] = {}
     needs_fix = False
-    for msg in msgs:
-        msg_uses, msg_results = extract_tool_ids(msg)
+    for msg_uses, msg_results in tool_ids:
         for rid in msg_results:
             if pending.get(rid, 0) <= 0:
                 needs_fix = True
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import asyncio
 from typing import Any
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
@@ -100,7 +101,8 @@ async def search_hub(
     q: str = "",
     limit: int = 20,
 ) -> list[HubSkillSpec]:
-    results = search_hub_skills(q, limit=limit)
+    # Hub requests block; keep them off the event loop
+    results = await asyncio.to_thread(search_hub_skills, q, limit=limit)
     return [
         HubSkillSpec(
             slug=item.slug,
@@ -116,7 +118,8 @@ async def search_hub(
 @router.post("/hub/install")
 async def install_from_hub(request: HubInstallRequest):
     try:
-        result = install_skill_from_hub(
+        result = await asyncio.to_thread(
+            install_skill_from_hub,
             bundle_url=request.bundle_url,
             version=request.version,
             enable=request.enable,
@@ -30,6 +30,14 @@ DOCS_ENABLED = os.environ.get("COPAW_OPENAPI_DOCS", "false").lower() in (
     "yes",
 )
 
+# When True, warm up the tokenizer and the prompt/skill caches when the
+# agent module is imported, so the first user message does not pay for it.
+WARMUP_ENABLED = os.environ.get("COPAW_WARMUP", "false").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+
 # Skills directories
 # Active skills directory (activated skills that agents use)
 ACTIVE_SKILLS_DIR = WORKING_DIR / "active_skills"
@@ -2,6 +2,7 @@
 """Environment variable management."""
 from .store import (
     delete_env_var,
+    get_environ_version,
     load_envs,
     load_envs_into_environ,
     save_envs,
@@ -10,6 +11,7 @@ from .store import (
 
 __all__ = [
     "delete_env_var",
+    "get_environ_version",
     "load_envs",
     "load_envs_into_environ",
     "save_envs",
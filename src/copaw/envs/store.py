@@ -18,6 +18,10 @@ from typing import Optional
 _ENVS_DIR = Path(__file__).resolve().parent
 _ENVS_JSON = _ENVS_DIR / "envs.json"
 
+# Bumped whenever this module changes ``os.environ``, so readers can
+# cache values derived from it.
+_environ_version = 0
+
 
 def get_envs_json_path() -> Path:
     """Return the default envs.json path."""
@@ -29,15 +33,27 @@ def get_envs_json_path() -> Path:
 # ------------------------------------------------------------------
 
 
+def get_environ_version() -> int:
+    """Return a counter that changes whenever env vars are applied."""
+    return _environ_version
+
+
+def _bump_environ_version() -> None:
+    global _environ_version
+    _environ_version += 1
+
+
 def _apply_to_environ(envs: dict[str, str]) -> None:
     """Set every key/value into ``os.environ``."""
     for key, value in envs.items():
         os.environ[key] = value
+    _bump_environ_version()
 
 
 def _remove_from_environ(key: str) -> None:
     """Remove *key* from ``os.environ`` if present."""
     os.environ.pop(key, None)
+    _bump_environ_version()
 
 
 def _sync_environ(
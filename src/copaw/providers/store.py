@@ -220,8 +220,16 @@ def save_providers_json(
         },
         "active_llm": data.active_llm.model_dump(mode="json"),
     }
+    text = json.dumps(out, indent=2, ensure_ascii=False)
+    # load_providers_json saves on every call; leave the file (and its
+    # mtime, which callers use for caching) alone if nothing changed
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return
+    except (OSError, UnicodeDecodeError):
+        pass
     with open(path, "w", encoding="utf-8") as fh:
-        json.dump(out, fh, indent=2, ensure_ascii=False)
+        fh.write(text)
 
 
 # -- Mutators --